@@ -15,12 +15,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import textwrap
 from datetime import datetime
 from typing import List, Dict, Any
 
+import orjson
+
 from langchain_core.messages import HumanMessage, SystemMessage, ToolMessage
 
 from app.agents.block_tools import (
@@ -45,6 +46,23 @@ def _json_serial(obj):
     raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
 
+def _dumps(obj, indent: bool = False) -> str:
+    """orjson 기반 JSON 문자열 변환 (UTF-8 그대로 출력, ensure_ascii=False와 동일)"""
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, default=_json_serial, option=option).decode()
+
+
+def _tool_result_summary(block: dict) -> dict:
+    """블록 생성 도구 결과를 ToolMessage용으로 요약 (생성 여부/타입/제목만)"""
+    return {
+        "status": "created",
+        "type": block.get("type", "unknown"),
+        "title": block.get("title", ""),
+    }
+
+
 # =============================================================================
 # 데이터 요약 및 준비
 # =============================================================================
@@ -75,24 +93,25 @@ def _prepare_data_for_analysis(research_payload: List[dict]) -> str:
         stats = item.get("stats", {})
         reasoning = item.get("reasoning", "")  # 수집 이유
         
-        section = f"### {tool_name} ({count}개 레코드)\n"
+        # 섹션 조각을 모아 한 번에 결합 (중간 문자열 재생성 방지)
+        parts = [f"### {tool_name} ({count}개 레코드)\n"]
         
         # 수집 이유가 있으면 표시
         if reasoning:
-            section += f"**수집 이유:** {reasoning}\n\n"
+            parts.append(f"**수집 이유:** {reasoning}\n\n")
         
         # 계산된 통계가 있으면 우선 사용 (이미 가공된 데이터)
         if stats:
-            section += "**사전 계산된 통계:**\n"
-            section += f"```json\n{json.dumps(stats, ensure_ascii=False, indent=2, default=_json_serial)}\n```\n"
+            parts.append(f"**사전 계산된 통계:**\n```json\n{_dumps(stats, indent=True)}\n```\n")
         
         # 원본 데이터 샘플 (최대 3개)
         if data and isinstance(data, list):
             sample_data = data[:3]
-            section += f"**데이터 샘플 ({min(3, len(data))}개):**\n"
-            section += f"```json\n{json.dumps(sample_data, ensure_ascii=False, indent=2, default=_json_serial)}\n```\n"
+            parts.append(
+                f"**데이터 샘플 ({len(sample_data)}개):**\n```json\n{_dumps(sample_data, indent=True)}\n```\n"
+            )
         
-        sections.append(section)
+        sections.append("".join(parts))
     
     return "\n".join(sections)
 
@@ -676,7 +695,7 @@ def _generate_paired_markdowns(
         json_end = response_text.rfind("]") + 1
         if json_match != -1 and json_end > json_match:
             json_str = response_text[json_match:json_end]
-            paired_markdowns = json.loads(json_str)
+            paired_markdowns = orjson.loads(json_str)
             logger.info(f"[ANALYSE_AGENT] 짝 마크다운 {len(paired_markdowns)}개 생성")
             return paired_markdowns
         else:
@@ -820,7 +839,7 @@ def _generate_comprehensive_analysis(
         
         if json_match != -1 and json_end > json_match:
             json_str = response_text[json_match:json_end]
-            sections = json.loads(json_str)
+            sections = orjson.loads(json_str)
             
             # 각 섹션을 마크다운 블록으로 변환
             comprehensive_blocks = []
@@ -1034,6 +1053,9 @@ def create_analyse_agent(tool_llm, summary_llm, toolkit):
     # 사용할 도구들 (block_tools.py에서 정의)
     # [create_markdown_block, create_chart_block, create_table_block, create_image_block, create_map_block, create_air_quality_block]
     tools = block_tools
+    tools_by_name = {t.name: t for t in tools}
+    # 도구 바인딩은 요청과 무관하므로 노드 생성 시 1회만 수행
+    llm_with_tools = tool_llm.bind_tools(tools)
 
     def analyse_agent_node(state):
         logger.info("[ANALYSE_AGENT] ====== 시작 ======")
@@ -1042,7 +1064,6 @@ def create_analyse_agent(tool_llm, summary_llm, toolkit):
         request_context = state.get("request_context", {})
         research_payload = state.get("research_payload", [])
         latest_image = state.get("latest_performance_image", "")
-        messages = list(state.get("messages", []))
         
         report_type = request_context.get("report_type", "user")
         org_name = request_context.get("organization_name", "해당 시설")
@@ -1097,8 +1118,6 @@ def create_analyse_agent(tool_llm, summary_llm, toolkit):
         # === 단계 4: LLM 호출 (도구 바인딩) ===
         logger.info(f"[ANALYSE_AGENT] LLM 호출 시작 (도구 {len(tools)}개)")
         
-        llm_with_tools = tool_llm.bind_tools(tools)
-        
         analysis_messages = [
             SystemMessage(content=system_prompt),
             HumanMessage(content="위 데이터를 분석하고 블록 생성 도구를 호출하여 보고서 블록을 만들어주세요.")
@@ -1133,7 +1152,7 @@ def create_analyse_agent(tool_llm, summary_llm, toolkit):
                 logger.info(f"[ANALYSE_AGENT] 도구 호출: {tool_name}")
                 
                 # 도구 찾기 및 실행
-                tool_fn = next((t for t in tools if t.name == tool_name), None)
+                tool_fn = tools_by_name.get(tool_name)
                 
                 if tool_fn:
                     try:
@@ -1144,11 +1163,11 @@ def create_analyse_agent(tool_llm, summary_llm, toolkit):
                         
                         logger.info(f"[ANALYSE_AGENT] 블록 생성 완료: {block.get('type', 'unknown')} - {block.get('title', block.get('content', '')[:30] if block.get('content') else '')}")
                         
-                        # 도구 결과 메시지 추가
+                        # 도구 결과 메시지 추가 (LLM이 만든 블록 본문은 되돌려 보내지 않고 요약만 전달)
                         analysis_messages.append(
                             ToolMessage(
                                 tool_call_id=tool_id,
-                                content=json.dumps(block, ensure_ascii=False, default=_json_serial)
+                                content=_dumps(_tool_result_summary(block))
                             )
                         )
                     except Exception as e:
@@ -1156,7 +1175,7 @@ def create_analyse_agent(tool_llm, summary_llm, toolkit):
                         analysis_messages.append(
                     ToolMessage(
                                 tool_call_id=tool_id,
-                                content=json.dumps({"error": str(e)})
+                                content=_dumps({"error": str(e)})
                             )
                         )
                 else:
@@ -1164,7 +1183,7 @@ def create_analyse_agent(tool_llm, summary_llm, toolkit):
                     analysis_messages.append(
                         ToolMessage(
                             tool_call_id=tool_id,
-                            content=json.dumps({"error": f"Unknown tool: {tool_name}"})
+                            content=_dumps({"error": f"Unknown tool: {tool_name}"})
                         )
                     )
             
@@ -1237,7 +1256,6 @@ def create_analyse_agent(tool_llm, summary_llm, toolkit):
         logger.info(f"[ANALYSE_AGENT] 최종 block_drafts: {len(block_drafts)}개 블록")
 
         return {
-            "messages": messages,
             "block_drafts": block_drafts,
         }
 
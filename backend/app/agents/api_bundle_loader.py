@@ -18,6 +18,7 @@ api_bundles.json에서 API 번들을 로드하고,
 import json
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -50,6 +51,7 @@ def reload_config() -> None:
     """설정 파일 강제 리로드 (개발용)"""
     global _API_BUNDLES_CONFIG
     _API_BUNDLES_CONFIG = None
+    get_preset_for_org.cache_clear()
     _load_config()
 
 
@@ -57,6 +59,8 @@ def reload_config() -> None:
 # Preset 조회
 # =============================================================================
 
+# 기관명은 요청에서 그대로 들어오므로 크기를 제한한 LRU로 매칭 결과 캐싱 (설정 리로드 시 초기화)
+@lru_cache(maxsize=256)
 def get_preset_for_org(org_name: str) -> str:
     """기관명에 맞는 API preset 반환"""
     config = _load_config()
@@ -115,6 +119,10 @@ def get_available_bundles() -> Dict[str, str]:
 # 변수 치환
 # =============================================================================
 
+# $ref.key.field 참조 패턴
+_REF_PATTERN = re.compile(r'\$ref\.([a-zA-Z_][a-zA-Z0-9_.]*)')
+
+
 def _substitute_vars(value: Any, context: Dict[str, Any]) -> Any:
     """
     변수 치환
@@ -149,7 +157,8 @@ def _substitute_vars(value: Any, context: Dict[str, Any]) -> Any:
                     return ""
             return str(val) if val else ""
         
-        result = re.sub(r'\$ref\.([a-zA-Z_][a-zA-Z0-9_.]*)', replace_ref, result)
+        if "$ref." in result:
+            result = _REF_PATTERN.sub(replace_ref, result)
         
         # 숫자 문자열 → 숫자 변환 시도
         if result.replace(".", "").replace("-", "").isdigit():
@@ -4,6 +4,7 @@ import os
 import re
 import calendar
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -25,6 +26,18 @@ def load_api_registry(config_path: Optional[str] = None) -> Dict:
     return configs
 
 
+@lru_cache(maxsize=256)
+def _substring_pattern(value: str) -> re.Pattern:
+    """substring 필터용 패턴 (대소문자 무시, 리터럴 매칭) - 항목마다 재컴파일하지 않도록 캐싱"""
+    return re.compile(re.escape(value), flags=re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _regex_pattern(value: str) -> re.Pattern:
+    """substring 필터의 정규식 fallback 패턴 (캐싱)"""
+    return re.compile(value)
+
+
 def filter_field(result: Dict, filter_rules: Optional[List[Dict]]) -> bool:
     """필터 규칙에 따라 데이터를 필터링합니다."""
     if filter_rules is None:
@@ -47,10 +60,10 @@ def filter_field(result: Dict, filter_rules: Optional[List[Dict]]) -> bool:
         elif operator == "substring":
             if result.get(field) is None:
                 continue
-            if re.search(re.escape(value), result[field], flags=re.IGNORECASE):
+            if _substring_pattern(value).search(result[field]):
                 flag = True
             else:
-                if re.search(value, result[field]):
+                if _regex_pattern(value).search(result[field]):
                     flag = True
     
     return flag
@@ -190,27 +203,32 @@ def call_kcisa_api(
         # filter_value는 사용하지 않음
 
         if filter_rules:
+            # 규칙 정규화(op 소문자화, value 공백 제거/소문자화)는 행마다 반복하지 않고 한 번만 수행
+            compiled_rules = []
+            for rule in filter_rules:
+                field = rule.get("field")
+                op = (rule.get("op") or rule.get("operator") or "contains").lower()
+                val = (rule.get("value") or "").strip()
+                if not field or not op or not val:
+                    # 불완전 규칙은 통과
+                    continue
+                if op in ("contains", "substring", "eq"):
+                    compiled_rules.append((field, op, val))
+                elif op == "icontains":
+                    compiled_rules.append((field, op, val.lower()))
+                # 모르는 op는 무시
+
             def _passes(r: Dict[str, Any]) -> bool:
-                for rule in filter_rules:
-                    field = rule.get("field")
-                    op = (rule.get("op") or rule.get("operator") or "contains").lower()
-                    val = (rule.get("value") or "").strip()
-                    if not field or not op or not val:
-                        # 불완전 규칙은 통과
-                        continue
+                for field, op, val in compiled_rules:
                     target = str(r.get(field) or "")
-                    if op == "contains" or op == "substring":
-                        if val not in target:
-                            return False
-                    elif op == "icontains":
-                        if val.lower() not in target.lower():
+                    if op == "icontains":
+                        if val not in target.lower():
                             return False
                     elif op == "eq":
                         if target != val:
                             return False
-                    else:
-                        # 모르는 op는 무시
-                        continue
+                    elif val not in target:
+                        return False
                 return True
 
             rows = [r for r in rows if _passes(r)]
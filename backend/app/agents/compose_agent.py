@@ -261,15 +261,15 @@ def _blocks_to_markdown(blocks: List[dict]) -> str:
             rows = block.get("rows", [])
             desc = block.get("description", "")
             
-            md_table = f"### {title}\n\n"
+            # 행 수만큼 문자열을 이어 붙이지 않고 줄 목록을 모아 한 번에 결합
+            lines = [f"### {title}\n\n"]
             if headers:
-                md_table += "| " + " | ".join(headers) + " |\n"
-                md_table += "| " + " | ".join(["---"] * len(headers)) + " |\n"
-            for row in rows:
-                md_table += "| " + " | ".join(str(cell) for cell in row) + " |\n"
+                lines.append("| " + " | ".join(headers) + " |\n")
+                lines.append("| " + " | ".join(["---"] * len(headers)) + " |\n")
+            lines.extend("| " + " | ".join(str(cell) for cell in row) + " |\n" for row in rows)
             if desc:
-                md_table += f"\n*{desc}*"
-            result.append(md_table)
+                lines.append(f"\n*{desc}*")
+            result.append("".join(lines))
         
         elif block_type == "map":
             title = block.get("title", "지도")
@@ -365,7 +365,6 @@ def create_final_report_compose_agent(llm):
     def compose_report_node(state):
         block_drafts = state.get("block_drafts", [])
         request_context = state.get("request_context", {})
-        messages: List = list(state.get("messages", []))
         
         logger.info(f"[COMPOSE_AGENT] 시작 - block_drafts {len(block_drafts)}개")
         
@@ -373,7 +372,6 @@ def create_final_report_compose_agent(llm):
         if not block_drafts:
             logger.warning("[COMPOSE_AGENT] block_drafts가 비어있음")
             return {
-                "messages": messages,
                 "final_report": "",
                 "blocks": [],
             }
@@ -439,8 +437,9 @@ def create_final_report_compose_agent(llm):
                     
                     elif tool_name in ("create_row_layout", "create_column_layout"):
                         # 레이아웃 도구 호출 확인 (실제 적용은 finalize에서)
+                        # 인자는 직전 AIMessage의 tool_calls에 이미 있으므로 되돌려 보내지 않음
                         compose_messages.append(ToolMessage(
-                            content=json.dumps({"status": "noted", "args": tool_args}),
+                            content=json.dumps({"status": "noted", "layout": tool_name}),
                             tool_call_id=tool_id
                         ))
                     
@@ -472,7 +471,6 @@ def create_final_report_compose_agent(llm):
         logger.info(f"[COMPOSE_AGENT] 완료 - blocks {len(blocks)}개")
         
         return {
-            "messages": messages,
             "final_report": final_report,
             "blocks": blocks,
         }
@@ -3,6 +3,23 @@ from sqlalchemy import text, Table, MetaData, select, and_, or_, desc, asc, case
 from sqlalchemy.orm import Session
 import json
 
+import orjson
+
+
+def _to_json(result: Any) -> str:
+    """조회 결과를 도구 반환용 JSON 문자열로 변환 (orjson, 실패 시 표준 json으로 폴백)
+
+    datetime/Decimal 등은 기존과 같이 str()로 변환되도록 orjson 기본 직렬화를 우회합니다.
+    """
+    try:
+        return orjson.dumps(
+            result,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        ).decode()
+    except TypeError:
+        return json.dumps(result, ensure_ascii=False, default=str, indent=2)
+
 
 class DBQueryTool:
     """동적 DB 쿼리를 위한 도구 클래스"""
@@ -219,7 +236,7 @@ def query_cultural_facility_data(
         limit=limit
     )
     
-    return json.dumps(result, ensure_ascii=False, default=str, indent=2)
+    return _to_json(result)
 
 
 def query_with_filters(
@@ -254,7 +271,7 @@ def query_with_filters(
         limit=limit
     )
     
-    return json.dumps(result, ensure_ascii=False, default=str, indent=2)
+    return _to_json(result)
 
 
 def query_with_range_and_search(
@@ -304,7 +321,7 @@ def query_with_range_and_search(
         limit=limit
     )
     
-    return json.dumps(result, ensure_ascii=False, default=str, indent=2)
+    return _to_json(result)
 
 
 def get_aggregate_statistics(
@@ -336,5 +353,5 @@ def get_aggregate_statistics(
         aggregate_function=aggregate_function
     )
     
-    return json.dumps(result, ensure_ascii=False, default=str, indent=2)
+    return _to_json(result)
 
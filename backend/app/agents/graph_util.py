@@ -28,7 +28,7 @@ class ReportingTools:
         if result["success"]:
             return {
                 "notes": f"{result['api_description']} 검색 완료: 총 {result['count']}개의 전시 정보를 찾았습니다.",
-                "sources": [item.get("URL") for item in result["data"] if item.get("URL")],
+                "sources": [url for item in result["data"] if (url := item.get("URL"))],
                 "data": result["data"]
             }
         else:
@@ -56,7 +56,7 @@ class ReportingTools:
         if result["success"]:
             return {
                 "notes": f"{result['api_description']} 검색 완료: 총 {result['count']}개의 소장품 정보를 찾았습니다.",
-                "sources": [item.get("url") for item in result["data"] if item.get("url")],
+                "sources": [url for item in result["data"] if (url := item.get("url"))],
                 "data": result["data"]
             }
         else:
@@ -95,7 +95,7 @@ class ReportingTools:
             def pick_source(it: dict):
                 return it.get("URL") or it.get("IMAGE_OBJECT") or it.get("LOCAL_ID")
 
-            sources = [pick_source(it) for it in data if pick_source(it)]
+            sources = [src for it in data if (src := pick_source(it))]
 
             return {
                 "notes": f"{result.get('api_description','공연정보')} 검색 완료: 총 {result.get('count', 0)}개의 공연 정보를 찾았습니다.",
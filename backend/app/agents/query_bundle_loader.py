@@ -8,6 +8,7 @@ query_bundles.json에서 쿼리 번들을 로드하고,
 import json
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 
@@ -32,9 +33,12 @@ def reload_config() -> None:
     """설정 파일 강제 리로드 (개발용)"""
     global _BUNDLES_CONFIG
     _BUNDLES_CONFIG = None
+    get_preset_for_org.cache_clear()
     _load_config()
 
 
+# 기관명은 요청에서 그대로 들어오므로 크기를 제한한 LRU로 매칭 결과 캐싱 (설정 리로드 시 초기화)
+@lru_cache(maxsize=256)
 def get_preset_for_org(org_name: str) -> str:
     """기관명에 맞는 preset 반환"""
     config = _load_config()
@@ -65,12 +69,17 @@ def get_bundles_for_preset(preset_name: str) -> List[str]:
     return bundles
 
 
+# $ref.key.field 참조 패턴
+_REF_PATTERN = re.compile(r'\$ref\.([a-zA-Z_][a-zA-Z0-9_.]*)')
+
+
 def _substitute_vars(value: Any, org_name: str) -> Any:
     """변수 치환: $org → 기관명, $ref.x.y → {x.y}"""
     if isinstance(value, str):
         result = value.replace("$org", org_name)
         # $ref.key.field → {key.field} 변환 (query_executor 형식)
-        result = re.sub(r'\$ref\.([a-zA-Z_][a-zA-Z0-9_.]*)', r'{\1}', result)
+        if "$ref." in result:
+            result = _REF_PATTERN.sub(r'{\1}', result)
         return result
     elif isinstance(value, dict):
         return {k: _substitute_vars(v, org_name) for k, v in value.items()}
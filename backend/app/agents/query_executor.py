@@ -1,5 +1,5 @@
 """
-Query Executor - DB 쿼리 순차 실행 및 통계 계산
+Query Executor - DB 쿼리 실행 (의존성 단계별 병렬) 및 통계 계산
 
 capstone DB에서 팀원 데이터를 조회합니다.
 """
@@ -8,7 +8,8 @@ import json
 import logging
 import math
 import re
-from typing import List, Dict, Any, Annotated, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Annotated, Iterator, Optional, Tuple, Union
 from langchain_core.tools import tool
 
 from app.db.context import get_capstone_db_context
@@ -26,13 +27,15 @@ def _safe_float(val: Any) -> float:
         return 0.0
 
 
+# 참조 문자열 패턴 (예: "{facility.slta_cd}")
+_REFERENCE_PATTERN = re.compile(r'\{([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)\}')
+
+
 def _resolve_reference(value: Any, context: Dict[str, Any]) -> Any:
     """참조 문자열을 실제 값으로 치환 (예: {facility.slta_cd} -> SLTA062)"""
-    if not isinstance(value, str):
+    if not isinstance(value, str) or "{" not in value:
         return value
     
-    pattern = r'\{([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)\}'
-    
     def replacer(match):
         path = match.group(1)
         parts = path.split('.')
@@ -48,7 +51,7 @@ def _resolve_reference(value: Any, context: Dict[str, Any]) -> Any:
         
         return str(result) if result is not None else match.group(0)
     
-    return re.sub(pattern, replacer, value)
+    return _REFERENCE_PATTERN.sub(replacer, value)
 
 
 def _resolve_params(params: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
@@ -208,6 +211,185 @@ def _calculate_demographics_stats(demographics: List[Dict]) -> Dict[str, Any]:
     }
 
 
+# stream_data_queries 마지막 항목(통계/오류) 표시용 키 - save_as 문자열과 겹치지 않도록 sentinel 사용
+STREAM_STATS = object()
+STREAM_ERRORS = object()
+
+# execute_data_queries 결과 dict에서 쿼리 결과(save_as)로 덮어쓸 수 없는 키
+_RESERVED_OUTPUT_KEYS = frozenset({"success", "errors", "stats"})
+
+
+# 통계 이름 → 통계 계산에 필요한 save_as
+_STATS_SOURCES = {
+    "review_stats": "reviews",
+    "demographics_stats": "demographics",
+}
+
+
+def _run_query(query_tool: DBQueryTool, query: Dict[str, Any], index: int, context: Dict[str, Any]) -> Tuple[List[Dict], Optional[str]]:
+    """단일 쿼리 실행 → (data, error)"""
+    action = query.get("action", "search")
+    table = query.get("table", "")
+    params = query.get("params", {})
+    save_as = query.get("save_as", f"result_{index}")
+    resolved_params = _resolve_params(params, context)
+    
+    logger.info(f"[QUERY_EXECUTOR] {index+1}. {action} on {table}, params={resolved_params}")
+    
+    try:
+        if action == "search":
+            data = query_tool.query(
+                table_name=table,
+                search_column=resolved_params.get("search_column"),
+                search_value=resolved_params.get("search_value"),
+                limit=resolved_params.get("limit", 10)
+            )
+        
+        elif action == "filter":
+            filters = resolved_params.get("filters", {})
+            if isinstance(filters, str):
+                filters = json.loads(filters)
+            
+            data = query_tool.query(
+                table_name=table,
+                filters=filters,
+                limit=resolved_params.get("limit", 50)
+            )
+        
+        elif action == "aggregate":
+            data = query_tool.get_aggregated_statistics(
+                table_name=table,
+                group_by=resolved_params.get("group_by"),
+                aggregate_column=resolved_params.get("aggregate_column"),
+                aggregate_function=resolved_params.get("aggregate_function", "count"),
+                filters=resolved_params.get("filters")
+            )
+        
+        else:
+            data = [{"error": f"Unknown action: {action}"}]
+        
+        logger.info(f"[QUERY_EXECUTOR] {save_as}: {len(data) if isinstance(data, list) else 1}개 결과")
+        return data, None
+        
+    except Exception as e:
+        error_msg = f"{table} 조회 오류: {str(e)}"
+        logger.warning(f"[QUERY_EXECUTOR] {error_msg}")
+        return [], error_msg
+
+
+def _summarize_result(data: Any) -> Dict[str, Any]:
+    """쿼리 결과 요약 (count, sample, keys)"""
+    if isinstance(data, list) and len(data) > 0:
+        first_item = data[0] if isinstance(data[0], dict) else {}
+        return {
+            "count": len(data),
+            "sample": data[:3],  # 샘플 3개만
+            "keys": list(first_item.keys()) if first_item else []
+        }
+    return {"count": 0, "sample": [], "keys": []}
+
+
+# 한 단계(wave)에서 동시에 실행할 최대 쿼리 수 (커넥션 풀 크기 이내)
+_MAX_PARALLEL_QUERIES = 8
+
+# 참조 대상 save_as 추출용 (예: "{facility.slta_cd}" -> "facility")
+_DEPENDENCY_PATTERN = re.compile(r'\{([a-zA-Z_][a-zA-Z0-9_]*)[.}]')
+
+
+def _plan_waves(queries: List[Dict[str, Any]]) -> List[List[int]]:
+    """
+    쿼리를 의존성 단계(wave)로 묶습니다.
+    
+    다른 쿼리 결과를 참조({save_as.column})하지 않는 쿼리는 같은 wave에서
+    동시에 실행되고, 참조하는 쿼리는 참조 대상이 끝난 다음 wave로 밀립니다.
+    """
+    level_of: Dict[str, int] = {}
+    waves: List[List[int]] = []
+    
+    for i, query in enumerate(queries):
+        params_text = json.dumps(query.get("params", {}), ensure_ascii=False, default=str)
+        deps = set(_DEPENDENCY_PATTERN.findall(params_text))
+        level = max((level_of[d] + 1 for d in deps if d in level_of), default=0)
+        
+        # 같은 save_as를 덮어쓰는 쿼리는 원래 순서를 유지
+        save_as = query.get("save_as", f"result_{i}")
+        if save_as in level_of:
+            level = max(level, level_of[save_as] + 1)
+        level_of[save_as] = level
+        
+        while len(waves) <= level:
+            waves.append([])
+        waves[level].append(i)
+    
+    return waves
+
+
+def _run_query_in_session(query: Dict[str, Any], index: int, context: Dict[str, Any]) -> Tuple[List[Dict], Optional[str]]:
+    """풀에서 세션을 하나 빌려 단일 쿼리 실행 (스레드별 세션)"""
+    with get_capstone_db_context() as db:
+        return _run_query(DBQueryTool(db), query, index, context)
+
+
+def stream_data_queries(
+    queries: List[Dict[str, Any]],
+    calculate_stats: Optional[List[str]] = None
+) -> Iterator[Tuple[Union[str, object], Any]]:
+    """
+    DB 쿼리를 실행하며 결과를 하나씩 반환합니다.
+    
+    쿼리가 끝날 때마다 (save_as, {"count", "sample", "keys"})를 계획 순서대로
+    yield하고, 마지막에 (STREAM_STATS, ...)와 (STREAM_ERRORS, ...)를 yield합니다.
+    같은 save_as가 여러 번 나오면 마지막 쿼리의 결과만 yield합니다.
+    
+    서로 의존하지 않는 쿼리는 커넥션 풀의 세션을 각각 사용해 동시에 실행합니다.
+    참조 해결({save_as.column})에는 첫 행만 쓰이므로 결과 전체는
+    통계 계산에 필요한 save_as만 유지하고 나머지는 바로 버립니다.
+    """
+    keep_full = {_STATS_SOURCES[s] for s in (calculate_stats or []) if s in _STATS_SOURCES}
+    context: Dict[str, Any] = {}
+    errors: List[str] = []
+    finished: Dict[int, Tuple[str, Dict[str, Any]]] = {}
+    next_index = 0
+    # save_as별 마지막 쿼리 위치 (중복 save_as는 마지막 결과만 사용)
+    last_of = {q.get("save_as", f"result_{i}"): i for i, q in enumerate(queries)}
+    
+    for wave in _plan_waves(queries):
+        if len(wave) == 1:
+            outcomes = [_run_query_in_session(queries[wave[0]], wave[0], context)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(wave), _MAX_PARALLEL_QUERIES)) as executor:
+                outcomes = list(executor.map(
+                    lambda i: _run_query_in_session(queries[i], i, context), wave
+                ))
+        
+        for i, (data, error) in zip(wave, outcomes):
+            save_as = queries[i].get("save_as", f"result_{i}")
+            if error:
+                errors.append(error)
+            
+            context[save_as] = data if save_as in keep_full or not isinstance(data, list) else data[:1]
+            finished[i] = (save_as, _summarize_result(data))
+        
+        while next_index in finished:
+            save_as, summary = finished.pop(next_index)
+            if last_of[save_as] == next_index:
+                yield save_as, summary
+            next_index += 1
+    
+    stats = {}
+    if calculate_stats:
+        if "review_stats" in calculate_stats and "reviews" in context:
+            stats["review_stats"] = _calculate_review_stats(context["reviews"])
+            logger.info(f"[QUERY_EXECUTOR] 리뷰 통계 계산 완료: {stats['review_stats']['summary']}")
+        
+        if "demographics_stats" in calculate_stats and "demographics" in context:
+            stats["demographics_stats"] = _calculate_demographics_stats(context["demographics"])
+            logger.info(f"[QUERY_EXECUTOR] 인구통계 분석 완료: {stats['demographics_stats']['summary']}")
+    
+    yield STREAM_STATS, stats if stats else None
+    yield STREAM_ERRORS, errors if errors else None
+
+
 @tool
 def execute_data_queries(
     queries: Annotated[List[Dict[str, Any]], """
@@ -261,88 +443,28 @@ params에서 "{save_as.column}" 형식으로 이전 쿼리 결과 참조 가능.
     ],
     calculate_stats=["review_stats", "demographics_stats"]
     """
-    results = {}
-    errors = []
-    
-    with get_capstone_db_context() as db:
-        query_tool = DBQueryTool(db)
-        
-        for i, query in enumerate(queries):
-            action = query.get("action", "search")
-            table = query.get("table", "")
-            params = query.get("params", {})
-            save_as = query.get("save_as", f"result_{i}")
-            resolved_params = _resolve_params(params, results)
-            
-            logger.info(f"[QUERY_EXECUTOR] {i+1}. {action} on {table}, params={resolved_params}")
-            
-            try:
-                if action == "search":
-                    data = query_tool.query(
-                        table_name=table,
-                        search_column=resolved_params.get("search_column"),
-                        search_value=resolved_params.get("search_value"),
-                        limit=resolved_params.get("limit", 10)
-                    )
-                
-                elif action == "filter":
-                    filters = resolved_params.get("filters", {})
-                    if isinstance(filters, str):
-                        filters = json.loads(filters)
-                    
-                    data = query_tool.query(
-                        table_name=table,
-                        filters=filters,
-                        limit=resolved_params.get("limit", 50)
-                    )
-                
-                elif action == "aggregate":
-                    data = query_tool.get_aggregated_statistics(
-                        table_name=table,
-                        group_by=resolved_params.get("group_by"),
-                        aggregate_column=resolved_params.get("aggregate_column"),
-                        aggregate_function=resolved_params.get("aggregate_function", "count"),
-                        filters=resolved_params.get("filters")
-                    )
-                
-                else:
-                    data = [{"error": f"Unknown action: {action}"}]
-                
-                results[save_as] = data
-                logger.info(f"[QUERY_EXECUTOR] {save_as}: {len(data) if isinstance(data, list) else 1}개 결과")
-                
-            except Exception as e:
-                error_msg = f"{table} 조회 오류: {str(e)}"
-                errors.append(error_msg)
-                results[save_as] = []
-                logger.warning(f"[QUERY_EXECUTOR] {error_msg}")
-    
-    stats = {}
-    if calculate_stats:
-        if "review_stats" in calculate_stats and "reviews" in results:
-            stats["review_stats"] = _calculate_review_stats(results["reviews"])
-            logger.info(f"[QUERY_EXECUTOR] 리뷰 통계 계산 완료: {stats['review_stats']['summary']}")
-        
-        if "demographics_stats" in calculate_stats and "demographics" in results:
-            stats["demographics_stats"] = _calculate_demographics_stats(results["demographics"])
-            logger.info(f"[QUERY_EXECUTOR] 인구통계 분석 완료: {stats['demographics_stats']['summary']}")
-    
     output = {
-        "success": len(errors) == 0,
-        "errors": errors if errors else None,
-        "stats": stats if stats else None,
+        "success": True,
+        "errors": None,
+        "stats": None,
     }
     
-    for key, data in results.items():
-        if isinstance(data, list) and len(data) > 0:
-            first_item = data[0] if isinstance(data[0], dict) else {}
-            output[key] = {
-                "count": len(data),
-                "sample": data[:3],  # 샘플 3개만
-                "keys": list(first_item.keys()) if first_item else []
-            }
+    reserved_errors: List[str] = []
+    for key, value in stream_data_queries(queries, calculate_stats):
+        if key is STREAM_STATS:
+            output["stats"] = value
+        elif key is STREAM_ERRORS:
+            output["errors"] = value
+        elif key in _RESERVED_OUTPUT_KEYS:
+            # 결과 필드(success/errors/stats)를 덮어쓰지 않도록 예약된 save_as는 결과에서 제외
+            logger.warning(f"[QUERY_EXECUTOR] 예약된 save_as '{key}'는 사용할 수 없어 결과에서 제외")
+            reserved_errors.append(f"예약된 save_as '{key}'는 사용할 수 없습니다")
         else:
-            output[key] = {"count": 0, "sample": [], "keys": []}
+            output[key] = value
+    
+    if reserved_errors:
+        output["errors"] = (output["errors"] or []) + reserved_errors
+    output["success"] = output["errors"] is None
     
     return output
 
@@ -5,132 +5,263 @@ Search Agent - 데이터 수집 에이전트
     1. DB 쿼리 계획 생성 (LLM) + 계획 설명 저장
     2. API 도구 선택 (LLM) + 호출 이유 저장
     3. DB 쿼리 실행 (기본 계획 + LLM 생성 쿼리)
-    4. API 호출 실행
+    4. API 호출 실행 (단계 3과 동시에 호출)
     5. 계획 설명 + 실행 결과를 research_payload에 저장
 """
 from __future__ import annotations
 import re
-import json
 import textwrap
 import logging
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+from calendar import monthrange
 
-from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
 from langchain_core.prompts import ChatPromptTemplate
 
 from app.agents.db_agent_tools import DB_SCHEMA_CONTEXT
-from app.agents.query_executor import execute_data_queries
+from app.agents.query_executor import STREAM_ERRORS, STREAM_STATS, execute_data_queries, stream_data_queries
 from app.agents.query_bundle_loader import get_all_for_org
 from app.agents import api_bundle_loader
 
 logger = logging.getLogger("uvicorn.error")
 
+# research_payload에 보관할 API 결과 최대 행 수
+# (Analyse Agent는 KCISA 결과에서 최대 15행까지만 표/이미지 블록으로 사용)
+_PAYLOAD_DATA_LIMIT = 15
 
-def create_search_agent(llm, toolkit):
-    """Search Agent 노드 생성"""
+# 단계4/5에서 동시에 실행할 최대 외부 API 호출 수
+_MAX_PARALLEL_API_CALLS = 4
 
-    def _filter_by_current_date(data: List[dict], current_date: str) -> List[dict]:
-        """현재 날짜 기준 진행 중인 공연/전시 필터링"""
-        if not current_date or not data:
-            return data
-        
-        date_fields = ["PERIOD", "EVENT_PERIOD", "period", "event_period"]
-        
+
+def _run_parallel(fn, arg_list: List[tuple], max_workers: int = _MAX_PARALLEL_API_CALLS) -> List[Tuple[Any, Optional[Exception]]]:
+    """
+    fn(*args)를 동시에 실행하고 입력 순서대로 (결과, 예외) 목록을 반환합니다.
+    
+    예외는 반환값으로 전달해 한 호출의 실패가 다른 호출에 영향을 주지 않도록 하며,
+    호출이 1건 이하면 스레드 없이 바로 실행합니다.
+    """
+    def _call(args):
         try:
-            today = datetime.strptime(current_date, "%Y-%m-%d")
-        except:
-            return data
-        
-        filtered = []
-        for item in data:
-            for field in date_fields:
-                period_str = item.get(field)
-                if not period_str:
-                    continue
-                
-                for sep in ["~", " - ", "-"]:
-                    if sep in str(period_str):
-                        parts = str(period_str).split(sep, 1)
-                        if len(parts) == 2:
-                            try:
-                                end_str = parts[1].strip().replace(".", "-").replace("/", "-")
-                                end_str = re.sub(r'(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})', r'\1-\2-\3', end_str)
-                                end_parts = end_str.split("-")
-                                if len(end_parts) == 3:
-                                    end_str = f"{end_parts[0]}-{end_parts[1].zfill(2)}-{end_parts[2].zfill(2)}"
-                                end_date = datetime.strptime(end_str, "%Y-%m-%d")
-                                if today <= end_date:
-                                    filtered.append(item)
-                                    break
-                            except:
-                                continue
-                        break
-                else:
-                    continue
-                break
-        
-        return filtered if filtered else data
+            return fn(*args), None
+        except Exception as e:
+            return None, e
+    
+    if len(arg_list) <= 1:
+        return [_call(args) for args in arg_list]
+    with ThreadPoolExecutor(max_workers=min(len(arg_list), max_workers)) as executor:
+        return list(executor.map(_call, arg_list))
 
-    def _extract_latest_image(data: List[dict]) -> str:
-        """최신 이미지 URL 추출"""
-        if not data:
-            return ""
-        
-        def extract_date(period_str):
-            if not period_str:
-                return None
-            try:
-                for sep in ["~", " - ", "-"]:
-                    if sep in str(period_str):
-                        parts = str(period_str).split(sep, 1)
-                        if len(parts) == 2:
-                            end_str = parts[1].strip().replace(".", "-").replace("/", "-")
-                            end_str = re.sub(r'(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})', r'\1-\2-\3', end_str)
-                            end_parts = end_str.split("-")
-                            if len(end_parts) == 3:
-                                end_str = f"{end_parts[0]}-{end_parts[1].zfill(2)}-{end_parts[2].zfill(2)}"
-                            return datetime.strptime(end_str, "%Y-%m-%d")
-            except:
-                pass
-            return None
-        
-        with_images = []
-        for item in data:
-            image_url = item.get("IMAGE_OBJECT") or item.get("image_object") or item.get("IMAGE") or item.get("image")
+
+# 단계2 API 선택 프롬프트에 노출할 도구 설명 (도구 이름 → 설명)
+_API_TOOL_DESCRIPTIONS = {
+    "search_exhibition_info_api": "전시 정보 검색 (미술관, 박물관, 갤러리용)",
+    "search_museum_collection_api": "소장품 검색 (박물관 전용)",
+    "search_performance_info_api": "공연 정보 검색 (공연장, 콘서트홀용)",
+}
+
+
+# 단계2 API 선택 LLM 호출이 실패했을 때 기관명으로 검색할 기본 API
+_FALLBACK_API_TOOLS = ("search_exhibition_info_api", "search_performance_info_api")
+
+
+# =============================================================================
+# 기간(PERIOD) 파싱 / 날짜 필터
+# =============================================================================
+
+# 기간 문자열 구분자 (앞에서부터 순서대로 시도)
+_PERIOD_SEPS = ("~", " - ", "-")
+_DATE_FIELDS = ("PERIOD", "EVENT_PERIOD", "period", "event_period")
+# 종료일 형식: 2025.01.31 / 2025-1-31 / 2025/01/31
+_END_DATE_RE = re.compile(r'(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})')
+# 기준일(current_date) 형식: 2025-01-31
+_CURRENT_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+
+# YYYYMMDD 정수 - datetime/튜플 생성 없이 정수 비교로 날짜 대소 판단
+# (연도는 정규식/고정 폭 파싱에서 항상 4자리이므로 순서가 보존됨)
+_YMD = int
+
+
+def _valid_ymd(y: int, mo: int, d: int) -> Optional[_YMD]:
+    """실제 존재하는 날짜면 YYYYMMDD 정수 반환"""
+    if 1 <= y and 1 <= mo <= 12 and 1 <= d <= monthrange(y, mo)[1]:
+        return y * 10000 + mo * 100 + d
+    return None
+
+
+def _to_ymd(m: re.Match) -> Optional[_YMD]:
+    """정규식 매치(년/월/일 그룹)를 유효한 YYYYMMDD 정수로 변환"""
+    return _valid_ymd(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+
+
+def _fast_period_end(period_str: str) -> Optional[_YMD]:
+    """
+    고정 폭 기간("2025-01-01~2025-12-31", "2025.01.01~2025.12.31")의 종료일을
+    정규식 없이 고정 오프셋 슬라이싱으로 파싱합니다. 형식이 다르면 None.
+    """
+    if (
+        len(period_str) != 21
+        or period_str.find("~") != 10
+        or period_str[15] not in ".-/"
+        or period_str[18] not in ".-/"
+    ):
+        return None
+    y, mo, d = period_str[11:15], period_str[16:18], period_str[19:21]
+    if not (y.isdecimal() and mo.isdecimal() and d.isdecimal()):
+        return None
+    return _valid_ymd(int(y), int(mo), int(d))
+
+
+def _parse_period_end(period_str: Any) -> Optional[_YMD]:
+    """기간 문자열("시작~종료")에서 종료일 파싱 (실패 시 None)"""
+    if not period_str:
+        return None
+    return _parse_period_end_cached(str(period_str))
+
+
+@lru_cache(maxsize=4096)
+def _parse_period_end_cached(period_str: str) -> Optional[_YMD]:
+    """
+    _parse_period_end의 실제 파싱 (문자열 단위 캐싱)
+    
+    전시/공연 목록은 같은 기간 문자열이 여러 항목에 반복되므로
+    고유 기간 문자열마다 한 번만 파싱합니다.
+    """
+    # 대부분의 공공 API 응답은 고정 폭 형식이므로 먼저 빠른 경로 시도
+    end = _fast_period_end(period_str)
+    if end:
+        return end
+    
+    for sep in _PERIOD_SEPS:
+        # 구분자 탐색과 종료 부분 추출을 한 번의 partition으로 처리
+        _, found, end_str = period_str.partition(sep)
+        if not found:
+            continue
+        m = _END_DATE_RE.fullmatch(end_str.strip())
+        if m:
+            end = _to_ymd(m)
+            if end:
+                return end
+    return None
+
+
+def _parse_current_date(current_date: str) -> Optional[_YMD]:
+    """기준일("2025-01-31") 파싱 (형식이 다르거나 없으면 None)"""
+    if not current_date:
+        return None
+    m = _CURRENT_DATE_RE.fullmatch(current_date)
+    return _to_ymd(m) if m else None
+
+
+def _item_end_date(item: dict) -> Optional[_YMD]:
+    """항목별로 구분자가 있는 첫 기간 필드의 종료일 (날짜 필터링 기준)"""
+    for field in _DATE_FIELDS:
+        # 값이 없거나 구분자가 없거나 파싱에 실패하면 다음 필드로
+        end_date = _parse_period_end(item.get(field))
+        if end_date is not None:
+            return end_date
+    return None
+
+
+_IMAGE_FIELDS = ("IMAGE_OBJECT", "image_object", "IMAGE", "image")
+_IMAGE_PERIOD_FIELDS = ("PERIOD", "EVENT_PERIOD", "period")
+
+
+def _first_value(item: dict, keys: Tuple[str, ...]) -> Any:
+    """keys 순서대로 처음 나오는 값 (모두 비어 있으면 마지막 값)"""
+    value = None
+    for key in keys:
+        value = item.get(key)
+        if value:
+            break
+    return value
+
+
+def _process_api_data(
+    data: List[dict],
+    today: Optional[_YMD],
+    want_image: bool,
+    filter_active: bool = True,
+) -> Tuple[List[dict], str]:
+    """
+    API 결과를 한 번 순회하며 날짜 필터링과 최신 이미지 선정을 함께 처리
+    
+    - filter_active이고 today가 있으면 종료일이 today 이후인 항목만 남기고,
+      남는 항목이 없으면 원본을 그대로 사용합니다.
+    - 이미지는 최종 사용 목록에서 종료일이 가장 늦은 항목의 것을 고릅니다.
+      한 응답의 항목들은 같은 필드 구성을 가지므로(xml_to_dict 표준화)
+      첫 항목에 실제 존재하는 키만 조회합니다.
+    
+    Returns:
+        (사용할 데이터, 이미지 URL 또는 "")
+    """
+    if not data:
+        return data, ""
+    if not filter_active:
+        today = None  # 진행 중 필터 비활성화 시 날짜 검사 생략
+    
+    image_keys: Tuple[str, ...] = ()
+    period_keys: Tuple[str, ...] = ()
+    if want_image:
+        first = data[0]
+        image_keys = tuple(k for k in _IMAGE_FIELDS if k in first)
+        period_keys = tuple(k for k in _IMAGE_PERIOD_FIELDS if k in first)
+        if not period_keys:
+            image_keys = ()
+    
+    if today is None and not image_keys:
+        return data, ""
+    
+    filtered = []
+    # 필터 통과 항목 / 전체 항목 각각의 최신 이미지 (필터 결과가 비면 전체 기준 사용)
+    best_kept, best_kept_end = "", None
+    best_all, best_all_end = "", None
+    for item in data:
+        kept = True
+        if today is not None:
+            end_date = _item_end_date(item)
+            kept = end_date is not None and today <= end_date
+            if kept:
+                filtered.append(item)
+        
+        if image_keys:
+            image_url = _first_value(item, image_keys)
             if image_url:
-                period = item.get("PERIOD") or item.get("EVENT_PERIOD") or item.get("period")
-                end_date = extract_date(period)
-                if end_date:
-                    with_images.append((end_date, image_url))
-        
-        if with_images:
-            with_images.sort(key=lambda x: x[0], reverse=True)
-            return with_images[0][1]
-        return ""
+                image_end = _parse_period_end(_first_value(item, period_keys))
+                if image_end:
+                    if best_all_end is None or image_end > best_all_end:
+                        best_all, best_all_end = image_url, image_end
+                    if kept and (best_kept_end is None or image_end > best_kept_end):
+                        best_kept, best_kept_end = image_url, image_end
+    
+    if today is None:
+        return data, best_all
+    if filtered:
+        return filtered, best_kept
+    return data, best_all
 
-    def search_agent_node(state):
-        request_context = state.get("request_context", {})
-        messages: List = list(state.get("messages", []))
-        
-        org_name = request_context.get("organization_name", "")
-        report_topic = request_context.get("report_topic", "")
-        current_date = request_context.get("current_date", "")
-        
-        research_payload = list(state.get("research_payload", []))
-        latest_performance_image = state.get("latest_performance_image", "")
 
-        logger.info(f"[SEARCH_AGENT] ====== 시작 ======")
-        logger.info(f"[SEARCH_AGENT] state: {state}")
-        logger.info(f"[SEARCH_AGENT] 기관명: {org_name}")
-        logger.info(f"[SEARCH_AGENT] 보고서 주제: {report_topic}")
+# =============================================================================
+# API 호출 중복 판정
+# =============================================================================
 
-        # 단계 1: DB 쿼리 계획
-        logger.info(f"[SEARCH_AGENT] [단계1] DB 쿼리 계획 LLM 호출")
-        
-        escaped_schema = DB_SCHEMA_CONTEXT.replace('{', '{{').replace('}', '}}')
-        
-        query_examples = """
+def _call_signature(tool_name: str, args: Any) -> Tuple:
+    """도구 호출 중복 판정용 해시 가능 키 (인자를 직렬화하지 않고 정렬된 튜플로 구성)"""
+    if not isinstance(args, dict):
+        return (tool_name, repr(args))
+    return (tool_name, tuple(sorted((k, repr(v)) for k, v in args.items())))
+
+
+def create_search_agent(llm, toolkit):
+    """Search Agent 노드 생성"""
+
+    # === 정적 프롬프트/체인 (노드 생성 시 1회 구성) ===
+    # 요청별 값(org_name, report_topic)은 템플릿 변수로 남겨 invoke 시 주입
+    # 요청 정보는 시스템 프롬프트 맨 끝에 두어 정적 부분(스키마/예시/지시)이
+    # 요청 간 동일한 접두부가 되도록 함 (OpenAI 프롬프트 캐싱 적중)
+    escaped_schema = DB_SCHEMA_CONTEXT.replace('{', '{{').replace('}', '}}')
+    
+    query_examples = """
 ## 쿼리 예시
 
 ### SNS버즈 시설 검색 -> slta_cd 획득 (구글맵 리뷰용)
@@ -148,45 +279,123 @@ def create_search_agent(llm, toolkit):
 ### LG U+ 페르소나 조회
 {"action": "filter", "table": "lguplus_dpg_persona_tot", "params": {"filters": {"cutr_facl_id": "{lgu_facility.cutr_facl_id}"}, "limit": 12}, "save_as": "persona"}
 """.replace('{', '{{').replace('}', '}}')
+    
+    db_plan_prompt = ChatPromptTemplate.from_messages([
+        ("system", textwrap.dedent(f"""
+            당신은 데이터베이스 쿼리 작성자입니다.
+            
+            # 데이터베이스 스키마
+            {escaped_schema}
+            
+            # 쿼리 예시
+            {query_examples}
+            
+            # 주의사항
+            - cri_ym(기준년월)은 정수형. 예: 202501
+            - cutr_facl_id(시설ID)는 정수형.
+            - 이전 쿼리 결과 참조: "{{{{save_as}}}}.{{{{column}}}}" 형식
+            
+            # 지시
+            1. 먼저 왜 이 쿼리들이 필요한지 간단히 설명하라 (1-2문장).
+            2. 그 다음 execute_data_queries를 호출하여 queries 배열에 쿼리를 담아 전달하라.
+            
+            # 요청 정보
+            - 기관명: {{org_name}}
+            - 보고서 주제: {{report_topic}}
+        """).strip()),
+        ("human", "'{org_name}' 보고서 작성에 필요한 모든 데이터를 DB에서 가져오기 위한 쿼리를 작성하고 execute_data_queries를 호출하라.")
+    ])
+    
+    db_tools = [execute_data_queries]
+    db_chain = db_plan_prompt | llm.bind_tools(db_tools)
+
+    api_tools = [
+        toolkit.search_exhibition_info_api,
+        toolkit.search_museum_collection_api,
+        toolkit.search_performance_info_api,
+    ]
+    
+    api_tool_map = {t.name: t for t in api_tools}
+    
+    # 진행 기간(PERIOD)이 있어 현재 날짜 기준 필터링 대상이 되는 API
+    dated_api_names = frozenset(
+        t.name for t in (toolkit.search_exhibition_info_api, toolkit.search_performance_info_api)
+    )
+    
+    # 사용 가능한 API 설명은 바인딩된 도구 구성으로 한 번만 생성
+    api_tools_description = "\n".join(
+        f"- {t.name}: {_API_TOOL_DESCRIPTIONS[t.name]}"
+        for t in api_tools
+        if t.name in _API_TOOL_DESCRIPTIONS
+    )
+    
+    api_plan_prompt = ChatPromptTemplate.from_messages([
+        ("system", textwrap.dedent("""
+            당신은 문화시설 API 선택 전문가입니다.
+            
+            # 사용 가능한 API
+            {api_tools_description}
+            
+            # 지시사항
+            1. 먼저 왜 이 API를 선택했는지 간단히 설명하세요 (1-2문장).
+            2. 기관 유형에 맞는 API를 선택하여 호출하세요.
+               - 미술관/박물관/갤러리: search_exhibition_info_api
+               - 박물관 소장품: search_museum_collection_api  
+               - 공연장/콘서트홀: search_performance_info_api
+            
+            keyword 파라미터에 기관명을 넣으세요.
+            
+            # 요청 정보
+            - 기관명: {org_name}
+            - 보고서 주제: {report_topic}
+        """).strip()),
+        ("human", "'{org_name}'에 적합한 API를 선택하여 호출하세요.")
+    ]).partial(api_tools_description=api_tools_description)
+    
+    api_chain = api_plan_prompt | llm.bind_tools(api_tools)
+
+    def search_agent_node(state):
+        request_context = state.get("request_context", {})
         
-        db_plan_prompt = ChatPromptTemplate.from_messages([
-            ("system", textwrap.dedent(f"""
-                당신은 데이터베이스 쿼리 작성자입니다.
-                
-                # 요청 정보
-                - 기관명: {org_name}
-                - 보고서 주제: {report_topic}
-                
-                # 데이터베이스 스키마
-                {escaped_schema}
-                
-                # 쿼리 예시
-                {query_examples}
-                
-                # 주의사항
-                - cri_ym(기준년월)은 정수형. 예: 202501
-                - cutr_facl_id(시설ID)는 정수형.
-                - 이전 쿼리 결과 참조: "{{{{save_as}}}}.{{{{column}}}}" 형식
-                
-                # 지시
-                1. 먼저 왜 이 쿼리들이 필요한지 간단히 설명하라 (1-2문장).
-                2. 그 다음 execute_data_queries를 호출하여 queries 배열에 쿼리를 담아 전달하라.
-            """).strip()),
-            ("human", f"'{org_name}' 보고서 작성에 필요한 모든 데이터를 DB에서 가져오기 위한 쿼리를 작성하고 execute_data_queries를 호출하라.")
-        ])
-        
-        db_tools = [execute_data_queries]
-        db_chain = db_plan_prompt | llm.bind_tools(db_tools)
+        org_name = request_context.get("organization_name", "")
+        report_topic = request_context.get("report_topic", "")
+        current_date = request_context.get("current_date", "")
+        filter_active = bool(request_context.get("filter_active_only", False))
+        today = _parse_current_date(current_date)  # 요청당 한 번만 파싱
         
+        # Research는 그래프의 첫 노드이므로 이전 payload를 복사하지 않고 새로 수집
+        research_payload: List[dict] = []
+        latest_performance_image = state.get("latest_performance_image", "")
+
+        logger.info(f"[SEARCH_AGENT] ====== 시작 ======")
+        # 전체 state(메시지 포함) 문자열화는 비용이 크므로 DEBUG일 때만 렌더링
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[SEARCH_AGENT] state: {state}")
+        logger.info(f"[SEARCH_AGENT] request_context: {request_context}")
+        logger.info(f"[SEARCH_AGENT] 기관명: {org_name}")
+        logger.info(f"[SEARCH_AGENT] 보고서 주제: {report_topic}")
+
+        # 프롬프트 변수 (요청별로 달라지는 값만 주입)
+        prompt_vars = {"org_name": org_name, "report_topic": report_topic}
+
+        # 단계 1/2의 계획 LLM 호출은 서로 독립적이므로 동시에 요청
+        logger.info(f"[SEARCH_AGENT] [단계1] DB 쿼리 계획 LLM 호출")
+        logger.info(f"[SEARCH_AGENT] [단계2] API 선택 LLM 호출")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            db_future = executor.submit(db_chain.invoke, prompt_vars)
+            api_future = executor.submit(api_chain.invoke, prompt_vars)
+
+        # 단계 1: DB 쿼리 계획
         try:
-            db_response = db_chain.invoke({})
+            db_response = db_future.result()
             logger.info(f"[SEARCH_AGENT] [단계1] DB 계획 LLM 응답 완료")
             logger.info(f"[SEARCH_AGENT] [단계1] 응답 타입: {type(db_response)}")
             if hasattr(db_response, "content"):
                 logger.info(f"[SEARCH_AGENT] [단계1] content: {str(db_response.content)[:300]}")
             if hasattr(db_response, "tool_calls"):
                 logger.info(f"[SEARCH_AGENT] [단계1] tool_calls 개수: {len(db_response.tool_calls) if db_response.tool_calls else 0}")
-                if db_response.tool_calls:
+                # 호출별 인자 덤프는 전체 args를 문자열화하므로 INFO가 꺼져 있으면 건너뜀
+                if db_response.tool_calls and logger.isEnabledFor(logging.INFO):
                     for i, tc in enumerate(db_response.tool_calls):
                         logger.info(f"[SEARCH_AGENT] [단계1] tool_call[{i}]: name={tc.get('name')}, args_keys={list(tc.get('args', {}).keys())}")
                         logger.info(f"[SEARCH_AGENT] [단계1] tool_call[{i}] args: {str(tc.get('args', {}))[:500]}")
@@ -234,9 +443,11 @@ def create_search_agent(llm, toolkit):
                 logger.info(f"[SEARCH_AGENT] [단계1] LLM 쿼리 추가: {q.get('save_as')}")
         
         merged_stats = list(default_stats)
-        for s in llm_stats:
-            if s not in merged_stats:
-                merged_stats.append(s)
+        existing_stats = set(merged_stats)
+        for stat in llm_stats:
+            if stat not in existing_stats:
+                merged_stats.append(stat)
+                existing_stats.add(stat)
         
         db_plan = {
             "queries": merged_queries,
@@ -246,47 +457,14 @@ def create_search_agent(llm, toolkit):
         logger.info(f"[SEARCH_AGENT] [단계1] 최종 DB 계획: queries={len(merged_queries)}개, stats={merged_stats}")
 
         # 단계 2: API 선택
-        logger.info(f"[SEARCH_AGENT] [단계2] API 선택 LLM 호출")
-        
-        api_tools = [
-            toolkit.search_exhibition_info_api,
-            toolkit.search_museum_collection_api,
-            toolkit.search_performance_info_api,
-        ]
-        
-        api_plan_prompt = ChatPromptTemplate.from_messages([
-            ("system", textwrap.dedent(f"""
-                당신은 문화시설 API 선택 전문가입니다.
-            
-            # 요청 정보
-                - 기관명: {org_name}
-                - 보고서 주제: {report_topic}
-                
-                # 사용 가능한 API
-                - search_exhibition_info_api: 전시 정보 검색 (미술관, 박물관, 갤러리용)
-                - search_museum_collection_api: 소장품 검색 (박물관 전용)
-                - search_performance_info_api: 공연 정보 검색 (공연장, 콘서트홀용)
-                
-                # 지시사항
-                1. 먼저 왜 이 API를 선택했는지 간단히 설명하세요 (1-2문장).
-                2. 기관 유형에 맞는 API를 선택하여 호출하세요.
-                   - 미술관/박물관/갤러리: search_exhibition_info_api
-                   - 박물관 소장품: search_museum_collection_api  
-                   - 공연장/콘서트홀: search_performance_info_api
-                
-                keyword 파라미터에 기관명을 넣으세요.
-            """).strip()),
-            ("human", f"'{org_name}'에 적합한 API를 선택하여 호출하세요.")
-        ])
-        
-        api_chain = api_plan_prompt | llm.bind_tools(api_tools)
-        
+        api_plan_failed = False
         try:
-            api_response = api_chain.invoke({})
+            api_response = api_future.result()
             logger.info(f"[SEARCH_AGENT] [단계2] API 선택 LLM 응답 완료")
         except Exception as e:
             logger.error(f"[SEARCH_AGENT] [단계2] API 선택 LLM 실패: {e}")
             api_response = None
+            api_plan_failed = True
         
         api_calls: List[Dict[str, Any]] = []
         api_plan_reasoning: str = ""  # LLM의 API 선택 이유
@@ -305,76 +483,117 @@ def create_search_agent(llm, toolkit):
                     "reasoning": api_plan_reasoning  # 각 API 호출에 이유 저장
                 })
             logger.info(f"[SEARCH_AGENT] [단계2] API 계획: {[c['name'] for c in api_calls]}")
+        elif api_plan_failed:
+            # API 선택 LLM 호출 자체가 실패한 경우에만 전시/공연 검색을 기본으로 수행
+            api_calls = [
+                {"name": name, "args": {"keyword": org_name}, "reasoning": "API 선택 LLM 호출에 실패하여 기본 전시/공연 정보 검색을 수행합니다."}
+                for name in _FALLBACK_API_TOOLS
+            ]
+            logger.warning(f"[SEARCH_AGENT] [단계2] API 선택 실패, 기본 API 사용: {list(_FALLBACK_API_TOOLS)}")
         else:
-            logger.warning(f"[SEARCH_AGENT] [단계2] API 선택 없음")
+            # LLM이 API가 필요 없다고 판단한 경우 외부 API를 호출하지 않음
+            logger.info(f"[SEARCH_AGENT] [단계2] LLM이 API를 선택하지 않음, API 호출 생략")
 
-        # 단계 3: DB 쿼리 실행
-        logger.info(f"[SEARCH_AGENT] [단계3] DB 계획 실행")
+        # 단계 4 준비: API 호출 계획 (중복 제거)
+        logger.info(f"[SEARCH_AGENT] [단계4] API 실행 ({len(api_calls)}개)")
         
-        try:
-            db_result = execute_data_queries.invoke(db_plan)
-            logger.info(f"[SEARCH_AGENT] [단계3] DB 실행 완료: {list(db_result.keys()) if isinstance(db_result, dict) else type(db_result)}")
+        planned_calls = []
+        seen_calls = set()
+        duplicate_calls = 0
+        for api_call in api_calls:
+            tool_name = api_call.get("name")
+            tool_fn = api_tool_map.get(tool_name)
+            if not tool_fn:
+                logger.warning(f"[SEARCH_AGENT] [단계4] API 도구 없음: {tool_name}")
+                continue
+            
+            # LLM이 같은 도구를 같은 인자로 중복 호출한 경우 한 번만 실행
+            call_key = _call_signature(tool_name, api_call.get("args") or {})
+            if call_key in seen_calls:
+                duplicate_calls += 1
+                continue
+            seen_calls.add(call_key)
+            
+            logger.info(f"[SEARCH_AGENT] [단계4] API 호출: {tool_name}")
+            planned_calls.append((api_call, tool_fn))
+        
+        if duplicate_calls:
+            logger.info(f"[SEARCH_AGENT] [단계4] 중복 API 호출 {duplicate_calls}개 생략")
+        
+        # 단계 4의 API 호출은 DB 조회와 무관하므로 단계 3 동안 백그라운드에서 먼저 시작
+        # (API 호출끼리도 동시에 실행하고, 결과는 단계 3 이후 계획 순서대로 처리)
+        with ThreadPoolExecutor(max_workers=1) as api_executor:
+            api_future = api_executor.submit(
+                _run_parallel,
+                lambda tool_fn, tool_args: tool_fn.invoke(tool_args),
+                [(fn, call.get("args", {})) for call, fn in planned_calls],
+            )
+                
+            # 단계 3: DB 쿼리 실행
+            logger.info(f"[SEARCH_AGENT] [단계3] DB 계획 실행")
             
-            if isinstance(db_result, dict):
-                skip_keys = {"success", "errors", "stats"}
-                for key, value in db_result.items():
-                    if key in skip_keys:
+            try:
+                db_keys = []
+                for key, value in stream_data_queries(db_plan["queries"], db_plan["calculate_stats"]):
+                    if key is STREAM_STATS:
+                        if value:
+                            research_payload.append({
+                                "tool": "calculated_stats",
+                                "stats": value,
+                                "block_configs": block_configs,  # 번들별 블록 설정 전달
+                                "reasoning": "리뷰 평점 분포와 방문자 인구통계를 분석하기 위해 자동 계산된 통계입니다."
+                            })
+                            logger.info(f"[SEARCH_AGENT] [단계3] 통계 추가: {list(value.keys())}, 블록 설정: {list(block_configs.keys())}")
                         continue
-                    if isinstance(value, dict) and value.get("count", 0) > 0:
+                    
+                    if key is STREAM_ERRORS:
+                        if value:
+                            logger.error(f"[SEARCH_AGENT] [단계3] DB 오류: {value}")
+                        continue
+                    
+                    db_keys.append(key)
+                    if value.get("count", 0) > 0:
                         research_payload.append({
                             "tool": f"execute_data_queries.{key}",
                             "count": value["count"],
-                            "sample": value.get("sample", []),
-                            "data": value.get("sample", []),  # Analyse Agent용
+                            "data": value.get("sample", []),  # Analyse Agent용 (샘플 행)
                             "reasoning": db_plan_reasoning  # 수집 이유/계획 설명
                         })
                         logger.info(f"[SEARCH_AGENT] [단계3] {key}: {value['count']}개 추가")
                 
-                stats = db_result.get("stats")
-                if stats:
-                    research_payload.append({
-                        "tool": "calculated_stats",
-                        "stats": stats,
-                        "block_configs": block_configs,  # 번들별 블록 설정 전달
-                        "reasoning": "리뷰 평점 분포와 방문자 인구통계를 분석하기 위해 자동 계산된 통계입니다."
-                    })
-                    logger.info(f"[SEARCH_AGENT] [단계3] 통계 추가: {list(stats.keys())}, 블록 설정: {list(block_configs.keys())}")
-                
-                if db_result.get("errors"):
-                    logger.error(f"[SEARCH_AGENT] [단계3] DB 오류: {db_result['errors']}")
-                    
-        except Exception as e:
-            logger.error(f"[SEARCH_AGENT] [단계3] DB 실행 실패: {e}")
+                logger.info(f"[SEARCH_AGENT] [단계3] DB 실행 완료: {db_keys}")
+                        
+            except Exception as e:
+                logger.error(f"[SEARCH_AGENT] [단계3] DB 실행 실패: {e}")
 
-        # 단계 4: API 호출 실행
-        logger.info(f"[SEARCH_AGENT] [단계4] API 실행 ({len(api_calls)}개)")
-        
-        api_tool_map = {t.name: t for t in api_tools}
+        # 단계 4: API 결과 처리
+        outcomes = api_future.result()
         
-        for api_call in api_calls:
+        for (api_call, _), (tool_result, error) in zip(planned_calls, outcomes):
             tool_name = api_call.get("name")
-            tool_args = api_call.get("args", {})
-            
-            tool_fn = api_tool_map.get(tool_name)
-            if not tool_fn:
-                logger.warning(f"[SEARCH_AGENT] [단계4] API 도구 없음: {tool_name}")
+            if error is not None:
+                logger.error(f"[SEARCH_AGENT] [단계4] API 실행 실패: {tool_name} - {error}")
                 continue
-
-            logger.info(f"[SEARCH_AGENT] [단계4] API 호출: {tool_name}")
+            
             try:
-                tool_result = tool_fn.invoke(tool_args)
-                
                 if isinstance(tool_result, dict):
-                    data = tool_result.get("data", [])
+                    # 도구가 {"data": None}을 돌려줘도 예외 없이 건너뛰도록 방어
+                    data = tool_result.get("data") or []
                     if data:
-                        if current_date and tool_name in ["search_exhibition_info_api", "search_performance_info_api"]:
-                            filtered = _filter_by_current_date(data, current_date)
+                        date_filter = filter_active and today is not None and tool_name in dated_api_names
+                        # 필터링할 날짜도 찾을 이미지도 없으면 결과 처리 블록 전체를 생략
+                        if date_filter or not latest_performance_image:
+                            # 날짜 필터링과 이미지 추출을 한 번의 순회로 처리
+                            filtered, img = _process_api_data(
+                                data,
+                                today if date_filter else None,
+                                want_image=not latest_performance_image,
+                                filter_active=filter_active,
+                            )
                             if len(filtered) < len(data):
                                 logger.info(f"[SEARCH_AGENT] [단계4] 날짜 필터링: {len(data)} -> {len(filtered)}")
                                 data = filtered
-                        
-                        if not latest_performance_image:
-                            img = _extract_latest_image(data)
+                            
                             if img:
                                 latest_performance_image = img
                                 logger.info(f"[SEARCH_AGENT] [단계4] 이미지 추출 완료")
@@ -382,8 +601,7 @@ def create_search_agent(llm, toolkit):
                         research_payload.append({
                             "tool": tool_name,
                             "count": len(data),
-                            "sample": data[:5],
-                            "data": data,
+                            "data": data[:_PAYLOAD_DATA_LIMIT],
                             "reasoning": api_call.get("reasoning", "")  # API 호출 이유
                         })
                         logger.info(f"[SEARCH_AGENT] [단계4] {tool_name}: {len(data)}개 결과")
@@ -442,25 +660,28 @@ def create_search_agent(llm, toolkit):
                 
                 logger.info(f"[SEARCH_AGENT] [단계5] preset: {preset}, 번들: {bundle_names}")
                 
-                for bundle_name in bundle_names:
-                    try:
-                        api_result, block_config = api_bundle_loader.execute_api_bundle(
-                            bundle_name, google_context
-                        )
-                        
-                        if api_result.get("success"):
-                            research_payload.append({
-                                "tool": f"google_api.{bundle_name}",
-                                "data": api_result,
-                                "block_config": block_config,
-                                "reasoning": f"Google API '{bundle_name}' 번들 실행 결과"
-                            })
-                            logger.info(f"[SEARCH_AGENT] [단계5] {bundle_name} 성공")
-                        else:
-                            logger.warning(f"[SEARCH_AGENT] [단계5] {bundle_name} 실패: {api_result.get('error')}")
-                    
-                    except Exception as bundle_error:
+                # 번들은 서로 독립적인 Google API 호출이므로 동시에 실행 (결과는 번들 순서대로 처리)
+                outcomes = _run_parallel(
+                    api_bundle_loader.execute_api_bundle,
+                    [(bundle_name, google_context) for bundle_name in bundle_names],
+                )
+                
+                for bundle_name, (bundle_output, bundle_error) in zip(bundle_names, outcomes):
+                    if bundle_error is not None:
                         logger.error(f"[SEARCH_AGENT] [단계5] {bundle_name} 오류: {bundle_error}")
+                        continue
+                    
+                    api_result, block_config = bundle_output
+                    if api_result.get("success"):
+                        research_payload.append({
+                            "tool": f"google_api.{bundle_name}",
+                            "data": api_result,
+                            "block_config": block_config,
+                            "reasoning": f"Google API '{bundle_name}' 번들 실행 결과"
+                        })
+                        logger.info(f"[SEARCH_AGENT] [단계5] {bundle_name} 성공")
+                    else:
+                        logger.warning(f"[SEARCH_AGENT] [단계5] {bundle_name} 실패: {api_result.get('error')}")
             else:
                 logger.info(f"[SEARCH_AGENT] [단계5] 좌표 없음, Google API 스킵")
         
@@ -488,7 +709,6 @@ def create_search_agent(llm, toolkit):
             logger.info(f"[SEARCH_AGENT]   - {tool}: {count_str}")
 
         return {
-            "messages": messages,
             "research_payload": research_payload,
             "latest_performance_image": latest_performance_image,
         }
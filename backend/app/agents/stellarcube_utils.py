@@ -5,7 +5,7 @@ AWS RDS capstone DB에서 월별 연령대 비율 데이터를 조회합니다.
 from typing import Dict, List, Optional, Any
 from sqlalchemy import create_engine, text
 from app.config import settings
-from app.db.session import CapstoneSessionLocal
+from app.db.context import get_capstone_db_context
 
 
 # 기관명 매핑
@@ -17,6 +17,53 @@ ORGANIZATION_MAPPING = {
 }
 
 
+# ============================================================================
+# 월별 연령대/성별 비율 쿼리 (모듈 로드 시 1회 생성하여 재사용)
+# ============================================================================
+
+# persona_metrics 테이블 사용 (문화시설 전체의 방문자 통계)
+# facilities 테이블과 조인하여 기관명으로 필터링
+_AGE_GENDER_BASE_QUERY = """
+    SELECT 
+        pm.cri_ym,
+        AVG(pm.persona_pct_20_male) as male_20s,
+        AVG(pm.persona_pct_30_male) as male_30s,
+        AVG(pm.persona_pct_40_male) as male_40s,
+        AVG(pm.persona_pct_50_male) as male_50s,
+        AVG(pm.persona_pct_60_male) as male_60s,
+        AVG(pm.persona_pct_70_male) as male_70s,
+        AVG(pm.persona_pct_20_female) as female_20s,
+        AVG(pm.persona_pct_30_female) as female_30s,
+        AVG(pm.persona_pct_40_female) as female_40s,
+        AVG(pm.persona_pct_50_female) as female_50s,
+        AVG(pm.persona_pct_60_female) as female_60s,
+        AVG(pm.persona_pct_70_female) as female_70s
+    FROM persona_metrics pm
+    JOIN facilities f ON pm.cutr_facl_id = f.cutr_facl_id
+    WHERE f.mrc_snbd_nm LIKE :org_pattern
+"""
+
+# 특정 년월 (cri_ym = 202501)
+_Q_YEARMONTH = text(_AGE_GENDER_BASE_QUERY + """
+    AND pm.cri_ym = :year_pattern
+    GROUP BY pm.cri_ym
+    ORDER BY pm.cri_ym
+""")
+
+# 특정 년도 전체 (cri_ym LIKE '2025%')
+_Q_YEAR = text(_AGE_GENDER_BASE_QUERY + """
+    AND pm.cri_ym::text LIKE :year_pattern
+    GROUP BY pm.cri_ym
+    ORDER BY pm.cri_ym
+""")
+
+# 전체 기간
+_Q_ALL = text(_AGE_GENDER_BASE_QUERY + """
+    GROUP BY pm.cri_ym
+    ORDER BY pm.cri_ym
+""")
+
+
 def get_organization_name_for_query(org_name: str) -> str:
     """기관명을 데이터베이스 조회용 이름으로 변환"""
     return ORGANIZATION_MAPPING.get(org_name, org_name)
@@ -63,31 +110,8 @@ def get_monthly_age_gender_ratio(
     try:
         db_org_name = get_organization_name_for_query(organization_name)
         
-        # capstone DB 연결 (팀원 데이터)
-        db = CapstoneSessionLocal()
-        try:
-            # persona_metrics 테이블 사용 (문화시설 전체의 방문자 통계)
-            # facilities 테이블과 조인하여 기관명으로 필터링
-            base_query = """
-                SELECT 
-                    pm.cri_ym,
-                    AVG(pm.persona_pct_20_male) as male_20s,
-                    AVG(pm.persona_pct_30_male) as male_30s,
-                    AVG(pm.persona_pct_40_male) as male_40s,
-                    AVG(pm.persona_pct_50_male) as male_50s,
-                    AVG(pm.persona_pct_60_male) as male_60s,
-                    AVG(pm.persona_pct_70_male) as male_70s,
-                    AVG(pm.persona_pct_20_female) as female_20s,
-                    AVG(pm.persona_pct_30_female) as female_30s,
-                    AVG(pm.persona_pct_40_female) as female_40s,
-                    AVG(pm.persona_pct_50_female) as female_50s,
-                    AVG(pm.persona_pct_60_female) as female_60s,
-                    AVG(pm.persona_pct_70_female) as female_70s
-                FROM persona_metrics pm
-                JOIN facilities f ON pm.cutr_facl_id = f.cutr_facl_id
-                WHERE f.mrc_snbd_nm LIKE :org_pattern
-            """
-            
+        # capstone DB 연결 (팀원 데이터) - 풀링된 capstone_engine 커넥션을 빌려 쓰고 자동 반납
+        with get_capstone_db_context() as db:
             # WHERE 조건 추가
             params = {"org_pattern": f"%{db_org_name}%"}
             
@@ -95,25 +119,14 @@ def get_monthly_age_gender_ratio(
                 if month:
                     # 특정 년월 (예: 2025년 1월 -> cri_ym = 202501)
                     params["year_pattern"] = int(f"{year}{month:02d}")
-                    query = text(base_query + """
-                        AND pm.cri_ym = :year_pattern
-                        GROUP BY pm.cri_ym
-                        ORDER BY pm.cri_ym
-                    """)
+                    query = _Q_YEARMONTH
                 else:
                     # 특정 년도 전체
                     params["year_pattern"] = f"{year}%"
-                    query = text(base_query + """
-                        AND pm.cri_ym::text LIKE :year_pattern
-                        GROUP BY pm.cri_ym
-                        ORDER BY pm.cri_ym
-                    """)
+                    query = _Q_YEAR
             else:
                 # 전체 기간
-                query = text(base_query + """
-                    GROUP BY pm.cri_ym
-                    ORDER BY pm.cri_ym
-                """)
+                query = _Q_ALL
             
             result = db.execute(query, params)
             rows = result.fetchall()
@@ -146,9 +159,6 @@ def get_monthly_age_gender_ratio(
                 "count": len(data)
             }
             
-        finally:
-            db.close()
-            
     except Exception as e:
         return {
             "success": False,
@@ -1,17 +1,30 @@
-import json
 import logging
 from datetime import datetime
+
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session, load_only
 
 from app.db.session import get_db
 from app.services.agent_report_service import agent_report_service
 from app.models.advanced_report import AdvancedReport
-from app.schemas.advanced_report import AdvancedReportRequest, AdvancedReportResponse
+from app.schemas.advanced_report import AdvancedReportRequest, AdvancedReportResponse, RatingStatistics
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/report", tags=["advanced-report"])
+# 응답 본문 직렬화는 orjson으로 처리 (chart_data 등 큰 dict 응답에서 stdlib json 대비 빠름)
+router = APIRouter(prefix="/report", tags=["advanced-report"], default_response_class=ORJSONResponse)
+
+
+def _parse_target_dates(raw: str | None) -> list[str] | None:
+    """analysis_target_dates 컬럼(JSON 배열 문자열) 파싱 (없거나 깨진 값은 None)"""
+    if not raw:
+        return None
+    try:
+        return orjson.loads(raw)
+    except (ValueError, TypeError):
+        return None
 
 
 @router.post("/advanced", response_model=AdvancedReportResponse)
@@ -34,11 +47,7 @@ async def generate_advanced_report(
                 raise HTTPException(status_code=404, detail=f"Parent report with id {request.parent_report_id} not found")
             depth = parent_report.depth + 1
             # 부모 보고서의 날짜 정보 가져오기
-            if parent_report.analysis_target_dates:
-                try:
-                    parent_analysis_target_dates = json.loads(parent_report.analysis_target_dates)
-                except:
-                    parent_analysis_target_dates = None
+            parent_analysis_target_dates = _parse_target_dates(parent_report.analysis_target_dates)
             parent_report_type = parent_report.report_type
         
         # 날짜 배열 구성: 부모 날짜가 있으면 사용, 없으면 요청에서 받은 날짜 사용
@@ -66,14 +75,21 @@ async def generate_advanced_report(
         # analysis_target_dates를 JSON 문자열로 변환하여 저장
         analysis_target_dates_json = None
         if result.get("analysis_target_dates"):
-            analysis_target_dates_json = json.dumps(result["analysis_target_dates"], ensure_ascii=False)
+            analysis_target_dates_json = orjson.dumps(result["analysis_target_dates"]).decode()
+        
+        # 평점 통계 데이터 변환 (검증 실패가 try 안에서 500으로 처리되도록 저장 전에 생성)
+        rating_stats = result.get("rating_statistics")
+        if rating_stats and isinstance(rating_stats, dict) and rating_stats.get("total_reviews", 0) > 0:
+            rating_statistics = RatingStatistics(**rating_stats)
+        else:
+            rating_statistics = None
         
         advanced_report = AdvancedReport(
             organization_name=request.organization_name,
             user_command=request.user_command,
             report_topic=result["report_topic"],
             final_report=result["final_report"],
-            research_sources_json=json.dumps(result["research_sources"], ensure_ascii=False),
+            research_sources_json=orjson.dumps(result["research_sources"]).decode(),
             analysis_summary=result["analysis_summary"],
             parent_report_id=request.parent_report_id,
             depth=depth,
@@ -85,21 +101,8 @@ async def generate_advanced_report(
         db.commit()
         db.refresh(advanced_report)
         
-        # 평점 통계 데이터 변환
-        rating_stats = result.get("rating_statistics")
-        if rating_stats and isinstance(rating_stats, dict) and rating_stats.get("total_reviews", 0) > 0:
-            from app.schemas.advanced_report import RatingStatistics
-            rating_statistics = RatingStatistics(**rating_stats)
-        else:
-            rating_statistics = None
-        
-        # analysis_target_dates를 JSON에서 파싱
-        analysis_target_dates_list = None
-        if advanced_report.analysis_target_dates:
-            try:
-                analysis_target_dates_list = json.loads(advanced_report.analysis_target_dates)
-            except:
-                analysis_target_dates_list = None
+        # 방금 저장한 값은 메모리에 있으므로 JSON을 다시 파싱하지 않고 그대로 사용
+        analysis_target_dates_list = result.get("analysis_target_dates") or None
         
         # chart_data 확인 및 로깅
         chart_data = result.get("chart_data", {})
@@ -110,22 +113,23 @@ async def generate_advanced_report(
         else:
             logger.warning("API 응답에 chart_data가 없습니다!")
         
-        return AdvancedReportResponse(
-            id=advanced_report.id,
-            organization_name=advanced_report.organization_name,
-            report_topic=advanced_report.report_topic,
-            final_report=advanced_report.final_report,
-            research_sources=json.loads(advanced_report.research_sources_json) if advanced_report.research_sources_json else [],
-            analysis_summary=advanced_report.analysis_summary or "",
-            generated_at=advanced_report.created_at,
-            generation_time_seconds=result.get("generation_time_seconds", 0.0),
-            chart_data=chart_data,  # 차트 데이터 추가
-            rating_statistics=rating_statistics,  # 평점 통계 데이터 추가
-            parent_report_id=advanced_report.parent_report_id,
-            depth=advanced_report.depth,
-            report_type=advanced_report.report_type,
-            analysis_target_dates=analysis_target_dates_list,
-        )
+        # 응답은 dict로 구성하고 검증은 response_model 직렬화 단계에서 한 번만 수행
+        return {
+            "id": advanced_report.id,
+            "organization_name": advanced_report.organization_name,
+            "report_topic": advanced_report.report_topic,
+            "final_report": advanced_report.final_report,
+            "research_sources": result["research_sources"],
+            "analysis_summary": advanced_report.analysis_summary or "",
+            "generated_at": advanced_report.created_at,
+            "generation_time_seconds": result.get("generation_time_seconds", 0.0),
+            "chart_data": chart_data,  # 차트 데이터 추가
+            "rating_statistics": rating_statistics,  # 평점 통계 데이터 추가
+            "parent_report_id": advanced_report.parent_report_id,
+            "depth": advanced_report.depth,
+            "report_type": advanced_report.report_type,
+            "analysis_target_dates": analysis_target_dates_list,
+        }
         
     except HTTPException:
         raise
@@ -148,48 +152,48 @@ async def get_child_reports(
             raise HTTPException(status_code=404, detail=f"Report with id {report_id} not found")
         
         # 하위 보고서 조회
-        child_reports = db.query(AdvancedReport).filter(
+        # 응답에 쓰는 컬럼만 로드 (user_command 등 응답에 없는 Text 컬럼은 가져오지 않음)
+        child_reports = db.query(AdvancedReport).options(
+            load_only(
+                AdvancedReport.id,
+                AdvancedReport.organization_name,
+                AdvancedReport.report_topic,
+                AdvancedReport.final_report,
+                AdvancedReport.research_sources_json,
+                AdvancedReport.analysis_summary,
+                AdvancedReport.created_at,
+                AdvancedReport.parent_report_id,
+                AdvancedReport.depth,
+                AdvancedReport.report_type,
+                AdvancedReport.analysis_target_dates,
+            )
+        ).filter(
             AdvancedReport.parent_report_id == report_id
         ).order_by(AdvancedReport.created_at.asc()).all()
         
-        result = []
-        for report in child_reports:
-            rating_stats = None
-            if report.research_sources_json:
-                try:
-                    # 평점 통계는 하위 보고서에서는 선택적으로 처리
-                    pass
-                except:
-                    pass
-            
-            # analysis_target_dates를 JSON에서 파싱
-            analysis_target_dates_list = None
-            if report.analysis_target_dates:
-                try:
-                    analysis_target_dates_list = json.loads(report.analysis_target_dates)
-                except:
-                    analysis_target_dates_list = None
-            
-            # 하위 보고서는 chart_data를 DB에 저장하지 않으므로 빈 객체 반환
-            # (차트 데이터는 부모 보고서 생성 시에만 수집됨)
-            result.append(AdvancedReportResponse(
-                id=report.id,
-                organization_name=report.organization_name,
-                report_topic=report.report_topic,
-                final_report=report.final_report,
-                research_sources=json.loads(report.research_sources_json) if report.research_sources_json else [],
-                analysis_summary=report.analysis_summary or "",
-                generated_at=report.created_at,
-                generation_time_seconds=0.0,  # 하위 보고서 조회 시에는 시간 정보 없음
-                chart_data={},  # 하위 보고서는 차트 데이터를 별도로 저장하지 않음
-                rating_statistics=rating_stats,
-                parent_report_id=report.parent_report_id,
-                depth=report.depth,
-                report_type=report.report_type,
-                analysis_target_dates=analysis_target_dates_list
-            ))
-        
-        return result
+        # 응답은 dict로 구성하고 검증은 response_model 직렬화 단계에서 한 번만 수행
+        # - 평점 통계는 하위 보고서에서는 저장하지 않음
+        # - 하위 보고서는 chart_data를 DB에 저장하지 않으므로 빈 객체 반환
+        #   (차트 데이터는 부모 보고서 생성 시에만 수집됨)
+        return [
+            {
+                "id": report.id,
+                "organization_name": report.organization_name,
+                "report_topic": report.report_topic,
+                "final_report": report.final_report,
+                "research_sources": orjson.loads(report.research_sources_json) if report.research_sources_json else [],
+                "analysis_summary": report.analysis_summary or "",
+                "generated_at": report.created_at,
+                "generation_time_seconds": 0.0,  # 하위 보고서 조회 시에는 시간 정보 없음
+                "chart_data": {},
+                "rating_statistics": None,
+                "parent_report_id": report.parent_report_id,
+                "depth": report.depth,
+                "report_type": report.report_type,
+                "analysis_target_dates": _parse_target_dates(report.analysis_target_dates),
+            }
+            for report in child_reports
+        ]
         
     except HTTPException:
         raise
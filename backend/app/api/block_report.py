@@ -7,7 +7,7 @@ block_reports 테이블에 저장됩니다. (capstone DB)
 import json
 import logging
 import time
-from typing import List
+from typing import Any, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
@@ -22,6 +22,19 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/report", tags=["block-report"])
 
 
+def _parse_json_text(raw: Optional[str], default: Any) -> Any:
+    """Text 컬럼에 저장된 JSON 문자열 파싱 (빈 값/빈 배열은 파싱 생략)"""
+    if not raw:
+        return default
+    # research_sources는 대부분 빈 배열로 저장되므로 디코딩 없이 반환
+    if raw == "[]":
+        return []
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        return default
+
+
 @router.post("/v2", response_model=BlockReportResponse)
 async def generate_block_report(
     request: BlockReportRequest,
@@ -100,20 +113,10 @@ async def get_block_report(
             raise HTTPException(status_code=404, detail="보고서를 찾을 수 없습니다.")
         
         # research_sources 파싱
-        research_sources = []
-        if report.research_sources_json:
-            try:
-                research_sources = json.loads(report.research_sources_json)
-            except json.JSONDecodeError:
-                research_sources = []
+        research_sources = _parse_json_text(report.research_sources_json, [])
         
         # analysis_target_dates 파싱
-        analysis_target_dates = None
-        if report.analysis_target_dates_json:
-            try:
-                analysis_target_dates = json.loads(report.analysis_target_dates_json)
-            except json.JSONDecodeError:
-                analysis_target_dates = None
+        analysis_target_dates = _parse_json_text(report.analysis_target_dates_json, None)
         
         return BlockReportResponse(
             id=report.id,
@@ -155,20 +158,10 @@ async def list_block_reports(
         result = []
         for report in reports:
             # research_sources 파싱
-            research_sources = []
-            if report.research_sources_json:
-                try:
-                    research_sources = json.loads(report.research_sources_json)
-                except json.JSONDecodeError:
-                    research_sources = []
+            research_sources = _parse_json_text(report.research_sources_json, [])
             
             # analysis_target_dates 파싱
-            analysis_target_dates = None
-            if report.analysis_target_dates_json:
-                try:
-                    analysis_target_dates = json.loads(report.analysis_target_dates_json)
-                except json.JSONDecodeError:
-                    analysis_target_dates = None
+            analysis_target_dates = _parse_json_text(report.analysis_target_dates_json, None)
             
             result.append(BlockReportResponse(
                 id=report.id,
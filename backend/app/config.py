@@ -17,6 +17,10 @@ class Settings(BaseSettings):
     llm_model: str = "gpt-4"
     llm_temperature: float = 0.3
     llm_max_tokens: int = 1500
+    # 동일 프롬프트 재호출 시 LLM 응답 재사용 (프로세스 메모리 캐시, 기본 비활성)
+    # 서버 시작 시 한 번만 적용되며, 보고서 프롬프트는 요청별 데이터를 포함하므로 크기를 제한
+    llm_cache_enabled: bool = False
+    llm_cache_maxsize: int = 256
     
     # Google Cloud Platform API 설정
     # Maps JavaScript, Places, Geocoding, Directions, Distance Matrix, Street View, Air Quality
@@ -11,7 +11,14 @@ SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 # capstone DB (팀원 데이터 + 새 보고서 저장용)
 # capstone_database_url이 없으면 database_url을 기본값으로 사용
 _capstone_url = settings.capstone_database_url or settings.database_url
-capstone_engine = create_engine(_capstone_url, pool_pre_ping=True)
+# search_agent가 독립 쿼리를 동시에 실행하므로 요청당 여러 커넥션을 사용
+capstone_engine = create_engine(
+    _capstone_url,
+    pool_pre_ping=True,
+    pool_size=20,
+    max_overflow=10,
+    pool_recycle=300,
+)
 CapstoneSessionLocal = sessionmaker(bind=capstone_engine, autocommit=False, autoflush=False)
 
 
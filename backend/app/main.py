@@ -3,6 +3,8 @@ import logging
 
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import set_llm_cache
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
@@ -33,6 +35,14 @@ app.include_router(simple_report.router)
 app.include_router(agent_report.router)
 app.include_router(block_report.router)  # Server-Driven UI 블록 기반 보고서
 
+@app.on_event("startup")
+async def setup_llm_cache():
+    # LLM 응답 캐시는 프로세스 전역 설정이므로 요청별 config가 아닌 시작 시점 설정으로만 결정
+    if settings.llm_cache_enabled:
+        set_llm_cache(InMemoryCache(maxsize=settings.llm_cache_maxsize))
+        logger.info(f"LLM 응답 캐시 활성화 (maxsize={settings.llm_cache_maxsize})")
+
+
 @app.on_event("startup")
 async def start_heartbeat():
     # 하트비트 태스크 시작
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -8,6 +8,11 @@ from app.db.base import Base
 
 class AdvancedReport(Base):
     __tablename__ = "advanced_reports"
+    # 하위 보고서 조회(WHERE parent_report_id = ? ORDER BY created_at)를 인덱스만으로 처리
+    # parent_report_id 단독 조회도 선두 컬럼으로 이 인덱스를 사용하므로 단일 컬럼 인덱스는 두지 않음
+    __table_args__ = (
+        Index("ix_advanced_reports_parent_report_id_created_at", "parent_report_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     organization_name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
@@ -25,7 +30,6 @@ class AdvancedReport(Base):
         Integer,
         ForeignKey("advanced_reports.id"),
         nullable=True,
-        index=True
     )
     depth: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     
@@ -47,7 +47,7 @@ class AgentReportService:
                 try:
                     parent_dates = json.loads(parent_report.analysis_target_dates)
                     final_analysis_target_dates = parent_dates.copy() if isinstance(parent_dates, list) else []
-                except:
+                except (ValueError, TypeError):
                     final_analysis_target_dates = []
             
             # additional_dates가 있으면 부모 날짜와 합치기 (중복 제거, 정렬)
@@ -151,7 +151,8 @@ class AgentReportService:
             # 최종 날짜 배열 가져오기 (반환값에 포함하기 위해)
             final_dates = initial_state["request_context"].get("analysis_target_dates", [])
             
-            result = graph.graph.invoke(initial_state)
+            # 동기 노드는 LangGraph가 executor 스레드에서 실행하므로 이벤트 루프를 막지 않음
+            result = await graph.graph.ainvoke(initial_state)
             
             # 종료 시간 기록 및 소요 시간 계산
             end_time = time.time()
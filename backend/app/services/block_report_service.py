@@ -109,8 +109,8 @@ class BlockReportService:
                 analysis_target_dates
             )
             
-            # 그래프 실행
-            result = graph.graph.invoke(initial_state)
+            # 그래프 실행 (동기 노드는 LangGraph가 executor 스레드에서 실행)
+            result = await graph.graph.ainvoke(initial_state)
             
             # 결과 추출
             blocks = result.get("blocks", [])
@@ -0,0 +1,43 @@
+"""advanced_reports (parent_report_id, created_at) 복합 인덱스
+
+하위 보고서 조회(WHERE parent_report_id = ? ORDER BY created_at)용 복합 인덱스를 만들고,
+선두 컬럼이 같아 중복이 되는 parent_report_id 단일 컬럼 인덱스를 제거합니다.
+
+Revision ID: 3f1c2a9d7b10
+Revises: 
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a9d7b10'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 테이블은 create_advanced_report_table.py(create_all)로 만들어졌으므로 존재 여부와 무관하게 안전하게 실행
+    op.create_index(
+        "ix_advanced_reports_parent_report_id_created_at",
+        "advanced_reports",
+        ["parent_report_id", "created_at"],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.drop_index("ix_advanced_reports_parent_report_id", table_name="advanced_reports", if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_advanced_reports_parent_report_id",
+        "advanced_reports",
+        ["parent_report_id"],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.drop_index("ix_advanced_reports_parent_report_id_created_at", table_name="advanced_reports", if_exists=True)
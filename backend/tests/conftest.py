@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# backend/ 디렉터리에서 `app` 패키지를 import할 수 있도록 경로 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,164 @@
+"""query_executor 단위 테스트 (DB 없이 쿼리 실행 함수를 대체해 검증)"""
+from contextlib import contextmanager
+
+import pytest
+
+from app.agents import query_executor as qe
+
+
+def _query(save_as, params=None):
+    return {"action": "filter", "table": "t", "params": params or {}, "save_as": save_as}
+
+
+# =============================================================================
+# _plan_waves
+# =============================================================================
+
+def test_independent_queries_share_one_wave():
+    queries = [_query("facility"), _query("reviews"), _query("demographics")]
+    assert qe._plan_waves(queries) == [[0, 1, 2]]
+
+
+def test_reference_chain_runs_in_order():
+    queries = [
+        _query("facility"),
+        _query("persona", {"filters": {"cutr_facl_id": "{facility.cutr_facl_id}"}}),
+        _query("trend", {"filters": {"id": "{persona.id}"}}),
+        _query("reviews"),
+    ]
+    assert qe._plan_waves(queries) == [[0, 3], [1], [2]]
+
+
+def test_reference_waits_for_deepest_dependency():
+    queries = [
+        _query("a"),
+        _query("b", {"x": "{a.id}"}),
+        _query("c", {"x": "{a.id}", "y": "{b.id}"}),
+    ]
+    assert qe._plan_waves(queries) == [[0], [1], [2]]
+
+
+def test_reference_inside_string_filters():
+    # filters가 JSON 문자열로 와도 참조를 찾아야 함
+    queries = [_query("facility"), _query("persona", {"filters": '{"id": "{facility.id}"}'})]
+    assert qe._plan_waves(queries) == [[0], [1]]
+
+
+@pytest.mark.parametrize("queries", [
+    # 자기 자신 참조
+    [_query("a", {"x": "{a.id}"})],
+    # 뒤에 나오는 쿼리 참조 (순환)
+    [_query("a", {"x": "{b.id}"}), _query("b", {"x": "{a.id}"})],
+    # 존재하지 않는 save_as 참조
+    [_query("a", {"x": "{missing.id}"})],
+])
+def test_self_forward_and_unknown_references_terminate(queries):
+    waves = qe._plan_waves(queries)
+    assert sorted(i for wave in waves for i in wave) == list(range(len(queries)))
+    assert waves[0][0] == 0
+
+
+def test_duplicate_save_as_keeps_plan_order():
+    queries = [_query("a"), _query("b"), _query("a")]
+    assert qe._plan_waves(queries) == [[0, 1], [2]]
+
+
+def test_missing_save_as_uses_result_index():
+    queries = [{"action": "filter", "table": "t", "params": {}}, _query("b", {"x": "{result_0.id}"})]
+    assert qe._plan_waves(queries) == [[0], [1]]
+
+
+# =============================================================================
+# _run_query_in_session / stream_data_queries
+# =============================================================================
+
+def test_run_query_in_session_opens_one_session_per_call(monkeypatch):
+    opened = []
+
+    @contextmanager
+    def fake_context():
+        db = object()
+        opened.append(db)
+        yield db
+
+    monkeypatch.setattr(qe, "get_capstone_db_context", fake_context)
+    monkeypatch.setattr(qe, "DBQueryTool", lambda db: db)
+    monkeypatch.setattr(qe, "_run_query", lambda tool, query, index, context: ([{"db": tool}], None))
+
+    first, _ = qe._run_query_in_session(_query("a"), 0, {})
+    second, _ = qe._run_query_in_session(_query("b"), 1, {})
+
+    assert len(opened) == 2
+    assert first[0]["db"] is opened[0]
+    assert second[0]["db"] is opened[1]
+
+
+def test_stream_caps_workers_at_max_parallel_queries(monkeypatch):
+    workers = []
+    real_executor = qe.ThreadPoolExecutor
+
+    def recording_executor(max_workers):
+        workers.append(max_workers)
+        return real_executor(max_workers=max_workers)
+
+    monkeypatch.setattr(qe, "ThreadPoolExecutor", recording_executor)
+    monkeypatch.setattr(qe, "_run_query_in_session", lambda query, index, context: ([{"i": index}], None))
+
+    queries = [_query(f"q{i}") for i in range(qe._MAX_PARALLEL_QUERIES + 5)]
+    list(qe.stream_data_queries(queries))
+
+    assert workers == [qe._MAX_PARALLEL_QUERIES]
+
+
+def test_stream_yields_in_plan_order_and_resolves_references(monkeypatch):
+    seen_params = {}
+
+    def fake_run(query, index, context):
+        seen_params[query["save_as"]] = qe._resolve_params(query["params"], context)
+        return [{"id": index + 100}], None
+
+    monkeypatch.setattr(qe, "_run_query_in_session", fake_run)
+
+    queries = [
+        _query("facility"),
+        _query("persona", {"filters": {"id": "{facility.id}"}}),
+        _query("reviews"),
+    ]
+    items = list(qe.stream_data_queries(queries))
+
+    assert [key for key, _ in items] == ["facility", "persona", "reviews", qe.STREAM_STATS, qe.STREAM_ERRORS]
+    assert seen_params["persona"] == {"filters": {"id": 100}}
+
+
+def test_stream_yields_duplicate_save_as_once_with_last_result(monkeypatch):
+    monkeypatch.setattr(qe, "_run_query_in_session", lambda query, index, context: ([{"i": index}], None))
+
+    items = list(qe.stream_data_queries([_query("a"), _query("b"), _query("a")]))
+
+    assert [key for key, _ in items[:-2]] == ["b", "a"]
+    assert items[1][1]["sample"] == [{"i": 2}]
+
+
+def test_stream_collects_errors_and_stats(monkeypatch):
+    def fake_run(query, index, context):
+        if query["save_as"] == "broken":
+            return [], "t 조회 오류: boom"
+        return [{"sns_content_rating": 5}, {"sns_content_rating": 3}], None
+
+    monkeypatch.setattr(qe, "_run_query_in_session", fake_run)
+
+    items = dict(qe.stream_data_queries([_query("reviews"), _query("broken")], ["review_stats"]))
+
+    assert items[qe.STREAM_ERRORS] == ["t 조회 오류: boom"]
+    assert items[qe.STREAM_STATS]["review_stats"]["total_reviews"] == 2
+
+
+def test_execute_data_queries_rejects_reserved_save_as(monkeypatch):
+    monkeypatch.setattr(qe, "_run_query_in_session", lambda query, index, context: ([{"i": index}], None))
+
+    output = qe.execute_data_queries.invoke({"queries": [_query("stats"), _query("facility")]})
+
+    assert output["success"] is False
+    assert output["stats"] is None
+    assert output["facility"]["count"] == 1
+    assert any("stats" in error for error in output["errors"])
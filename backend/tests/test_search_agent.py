@@ -0,0 +1,150 @@
+"""search_agent 기간 파싱 / API 결과 처리 단위 테스트"""
+import pytest
+
+from app.agents import search_agent as sa
+
+
+# =============================================================================
+# _fast_period_end / _parse_period_end
+# =============================================================================
+
+@pytest.mark.parametrize("period, expected", [
+    ("2025.01.01~2025.12.31", 20251231),
+    ("2025-01-01~2025-02-28", 20250228),
+    ("2024/01/01~2024/02/29", 20240229),
+])
+def test_fast_period_end_fixed_width(period, expected):
+    assert sa._fast_period_end(period) == expected
+
+
+@pytest.mark.parametrize("period", [
+    "2025.1.1~2025.12.31",    # 고정 폭이 아님
+    "2025.01.01 ~ 2025.12.31",
+    "2025.01.01-2025.12.31",  # '~' 위치가 다름
+    "2025.01.01~2025_12_31",  # 구분자가 다름
+    "2025.01.01~20a5.12.31",  # 숫자가 아님
+    "2025.01.01~2025.02.30",  # 존재하지 않는 날짜
+    "2025.01.01~2025.13.01",
+    "2025.01.01~2025.00.10",
+    "2023.01.01~2023.02.29",  # 윤년 아님
+])
+def test_fast_period_end_rejects_other_formats(period):
+    assert sa._fast_period_end(period) is None
+
+
+@pytest.mark.parametrize("period, expected", [
+    ("2025.01.01~2025.12.31", 20251231),
+    ("2025.1.1~2025.1.5", 20250105),
+    ("2025.01.01 ~ 2025.01.05 ", 20250105),
+    ("2024.01.01 - 2025.1.5", 20250105),
+    ("2023-01-01-2023-02-01", None),  # '-'로 나누면 종료 부분이 날짜 형식이 아님
+    ("2020/1/1~2026/02/28", 20260228),
+])
+def test_parse_period_end_variants(period, expected):
+    assert sa._parse_period_end(period) == expected
+
+
+@pytest.mark.parametrize("period", [
+    None,
+    "",
+    "상설",
+    "2025.01.01",             # 구분자 없음
+    "2025.01.01~",            # 종료일 없음
+    "2025.01.01~미정",
+    "2020~2030.01.01 추가",
+    "2025.01.01~2025.02.30",  # 존재하지 않는 날짜
+    "2025.01.01~2025.2.29",
+    "2025.01.01~2025.12.32",
+    "2025.01.01~0000.01.01",
+])
+def test_parse_period_end_malformed_returns_none(period):
+    assert sa._parse_period_end(period) is None
+
+
+def test_parse_period_end_accepts_non_string():
+    assert sa._parse_period_end(20250101) is None
+
+
+@pytest.mark.parametrize("current_date, expected", [
+    ("2025-01-31", 20250131),
+    ("2025-1-5", 20250105),
+    ("2025-02-30", None),
+    ("2025.01.31", None),
+    ("", None),
+])
+def test_parse_current_date(current_date, expected):
+    assert sa._parse_current_date(current_date) == expected
+
+
+def test_item_end_date_uses_first_parsable_field():
+    item = {"PERIOD": "상설", "EVENT_PERIOD": "2025.01.01~2025.03.01", "period": "2025.01.01~2026.01.01"}
+    assert sa._item_end_date(item) == 20250301
+    assert sa._item_end_date({"TITLE": "x"}) is None
+
+
+# =============================================================================
+# _process_api_data
+# =============================================================================
+
+TODAY = 20250601
+
+
+def _item(title, period, image=""):
+    return {"TITLE": title, "PERIOD": period, "IMAGE_OBJECT": image}
+
+
+def test_process_api_data_keeps_active_items():
+    data = [
+        _item("old", "2024.01.01~2024.12.31"),
+        _item("now", "2025.01.01~2025.12.31"),
+        _item("today", "2025.01.01~2025.06.01"),
+        _item("unknown", "미정"),
+    ]
+    filtered, img = sa._process_api_data(data, TODAY, want_image=False)
+    assert [i["TITLE"] for i in filtered] == ["now", "today"]
+    assert img == ""
+
+
+def test_process_api_data_falls_back_to_all_items_when_none_active():
+    data = [_item("old", "2024.01.01~2024.12.31", "old.jpg"), _item("older", "2023.01.01~2023.12.31", "older.jpg")]
+    filtered, img = sa._process_api_data(data, TODAY, want_image=True)
+    assert filtered is data
+    assert img == "old.jpg"
+
+
+def test_process_api_data_picks_latest_image_among_kept_items():
+    data = [
+        _item("old", "2024.01.01~2024.12.31", "old.jpg"),
+        _item("a", "2025.01.01~2025.07.01", "a.jpg"),
+        _item("b", "2025.01.01~2025.09.01", "b.jpg"),
+        _item("no-image", "2025.01.01~2026.01.01"),
+    ]
+    filtered, img = sa._process_api_data(data, TODAY, want_image=True)
+    assert [i["TITLE"] for i in filtered] == ["a", "b", "no-image"]
+    assert img == "b.jpg"
+
+
+def test_process_api_data_without_today_returns_data_unchanged():
+    data = [_item("old", "2024.01.01~2024.12.31", "old.jpg"), _item("new", "2025.01.01~2025.12.31", "new.jpg")]
+    filtered, img = sa._process_api_data(data, None, want_image=True)
+    assert filtered is data
+    assert img == "new.jpg"
+
+    filtered, img = sa._process_api_data(data, None, want_image=False)
+    assert filtered is data
+    assert img == ""
+
+
+def test_process_api_data_filter_inactive_skips_date_check():
+    data = [_item("old", "2024.01.01~2024.12.31"), _item("new", "2025.01.01~2025.12.31")]
+    filtered, _ = sa._process_api_data(data, TODAY, want_image=False, filter_active=False)
+    assert filtered is data
+
+
+def test_process_api_data_ignores_images_without_period_fields():
+    data = [{"TITLE": "a", "IMAGE_OBJECT": "a.jpg"}]
+    assert sa._process_api_data(data, None, want_image=True) == (data, "")
+
+
+def test_process_api_data_empty():
+    assert sa._process_api_data([], TODAY, want_image=True) == ([], "")